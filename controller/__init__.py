@@ -1,5 +1,17 @@
 from controller.ai_algorithm import MinimaxAlgorithm
-from controller.ai_controller import AIController
-from controller.game_controller import GameController
 
 __all__ = ["GameController", "AIController", "MinimaxAlgorithm"]
+
+
+def __getattr__(name):
+    # The Qt controllers load on first use, so the search engine can be
+    # imported by worker processes and headless tools without PyQt6
+    if name == "AIController":
+        from controller.ai_controller import AIController
+
+        return AIController
+    if name == "GameController":
+        from controller.game_controller import GameController
+
+        return GameController
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
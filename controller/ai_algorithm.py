@@ -1,14 +1,104 @@
+import time
 from typing import Callable, Optional, Tuple
 
-from model import GameRules, GameState, MoveValidator, PositionEvaluator
+from controller.deepening import IterativeDeepening, SearchTimeout
+from controller.move_ordering import MoveOrderer
+from controller.progress import SearchProgress
+from controller.search_stats import SearchStats
+from controller.transposition import (
+    EXACT,
+    LOWER_BOUND,
+    UPPER_BOUND,
+    TranspositionTable,
+)
+from model import (
+    BitboardState,
+    GameRules,
+    GameState,
+    Move,
+    MoveValidator,
+    PositionEvaluator,
+    ThreatDetector,
+)
+from model.moves import move_to
+from model.threats import CONE_MASKS
 
 
-class MinimaxAlgorithm:
-    def __init__(self, human_player: int = None):
+class MinimaxAlgorithm(IterativeDeepening):
+    # Checking the clock every node is measurable; 1024 nodes is ~10ms
+    TIME_CHECK_INTERVAL = 1024
+    # Half-width of the root window around the expected score
+    ASPIRATION_WINDOW = 25
+    # Quiescence nodes allowed below each leaf; 0 disables quiescence
+    QUIESCENCE_NODE_BUDGET = 32
+    # Depth cap for searches limited by time, nodes or a stop, not depth
+    MAX_TIMED_DEPTH = 32
+    # No new iteration starts once this share of a time budget is spent
+    SOFT_LIMIT_FRACTION = 0.5
+
+    # Late move reductions: from this depth, quiet moves ordered after the
+    # first few are searched this many plies shallower, and again at full
+    # depth only if they beat alpha. Scores swing between odd and even
+    # depths, so a one-ply reduction fails high most of the time; two
+    # plies keep the parity
+    LMR_MIN_DEPTH = 4
+    LMR_FULL_DEPTH_MOVES = 3
+    LMR_REDUCTION = 2
+
+    def __init__(
+        self,
+        tt_size_mb: float = TranspositionTable.DEFAULT_SIZE_MB,
+        quiescence_budget: int = QUIESCENCE_NODE_BUDGET,
+        instrument: bool = False,
+        late_move_reductions: bool = True,
+        futility_pruning: bool = True,
+        transposition_table: Optional[TranspositionTable] = None,
+    ):
         self.nodes_visited = 0
+        self.interior_nodes = 0
+        self.leaf_nodes = 0
+        self.quiescence_nodes = 0
+        self.quiescence_budget = quiescence_budget
+        self.quiescence_budget_left = 0
         self.evaluation_callback = None
-        self.move_evaluation_callback = None
-        self.human_player = human_player
+        self.progress = None
+
+        # Engines given one table share everything it learns
+        self.transposition_table = transposition_table or TranspositionTable(
+            tt_size_mb
+        )
+        self.move_orderer = MoveOrderer()
+
+        self.cutoffs = 0
+        self.first_move_cutoffs = 0
+        self.aspiration_researches = 0
+
+        # Selective search, each part switchable on its own
+        self.late_move_reductions = late_move_reductions
+        self.futility_pruning = futility_pruning
+        self.reductions = 0
+        self.reduction_researches = 0
+        self.futility_prunes = 0
+        self.futility_margins = self._futility_margins()
+
+        # Triangular PV table: pv_table[ply] is the best line from that ply
+        self.pv_table = [[] for _ in range(MoveOrderer.MAX_PLY + 1)]
+        self.principal_variation = []
+
+        # Phase timing slows the search, so it is off unless asked for
+        self.instrument = instrument
+        self.search_stats = SearchStats(instrument)
+        self._bind_phases()
+
+        self.deadline = None
+        self.node_limit = None
+        self.completed_depth = 0
+        # Set from another thread to abandon the search in progress, or
+        # through a multiprocessing Event shared with another process
+        self.stop_requested = False
+        self.stop_event = None
+        # Cleared while iterative deepening runs depth 1, which ignores stops
+        self.stoppable = True
 
     def find_best_move(
         self,
@@ -16,97 +106,581 @@ class MinimaxAlgorithm:
         player: int,
         depth: int,
         evaluation_callback: Optional[Callable] = None,
-        move_evaluation_callback: Optional[Callable] = None,
-    ) -> Tuple[float, Optional[Tuple[Tuple[int, int], Tuple[int, int]]]]:
+        progress: Optional[SearchProgress] = None,
+    ) -> Tuple[float, Optional[Move]]:
+        self._start_search(player, evaluation_callback, progress)
+        self.deadline = None
+        if progress is not None:
+            progress.start_iteration(depth)
+
+        position = BitboardState.from_game_state(state)
+
+        self.search_stats.start_iteration(self.get_counters())
+        result = self._negamax(position, depth, float("-inf"), float("inf"), player)
+        self.search_stats.finish_iteration(depth, self.get_counters())
+        self.principal_variation = list(self.pv_table[0])
+        self.completed_depth = depth
+        if progress is not None:
+            progress.finish_iteration(depth, result[0], self.principal_variation)
+        return result
+
+    def _start_deepening(
+        self,
+        state: GameState,
+        player: int,
+        evaluation_callback: Optional[Callable],
+        progress: Optional[SearchProgress],
+    ) -> None:
+        self._start_search(player, evaluation_callback, progress)
+        self.root_state = state
+
+    def _search_depth(
+        self,
+        depth: int,
+        player: int,
+        expected_score: Optional[float],
+        deadline: Optional[float],
+        node_limit: Optional[int],
+        stoppable: bool,
+    ) -> Tuple[float, Optional[Move]]:
+        # The previous principal variation comes first via the table
+        self.deadline = deadline
+        self.node_limit = node_limit
+        self.stoppable = stoppable
+        try:
+            position = BitboardState.from_game_state(self.root_state)
+            result = self._aspiration_search(position, depth, player, expected_score)
+        finally:
+            self.deadline = None
+            self.node_limit = None
+            self.stoppable = True
+        self.principal_variation = list(self.pv_table[0])
+        return result
+
+    def search_root_move(
+        self,
+        position: BitboardState,
+        move: Move,
+        depth: int,
+        player: int,
+        alpha: float = float("-inf"),
+        beta: float = float("inf"),
+        deadline: Optional[float] = None,
+        scout: bool = False,
+        node_limit: Optional[int] = None,
+        stoppable: bool = True,
+    ) -> float:
+        """Score one root move of a depth-ply search for root splitting.
+
+        With scout set, the move is first tried with a null window at
+        alpha and only re-searched with the full window if it fails high.
+        A score at or below alpha is only an upper bound. The line found
+        is left in principal_variation. Raises SearchTimeout once
+        perf_counter passes deadline or the move has taken node_limit
+        nodes, or on a stop unless stoppable is cleared.
+        """
+        # One search is spread over many of these calls, so history is
+        # kept rather than aged each time
+        self._start_search(player, None, None, age_history=False)
+        self.deadline = deadline
+        self.node_limit = node_limit
+        self.stoppable = stoppable
+        opponent = GameRules.get_opponent(player)
+
+        undo = self._make_move(position, move)
+        try:
+            if scout and alpha > float("-inf"):
+                score = -self._negamax(
+                    position, depth - 1, -alpha - 1, -alpha, opponent, 1
+                )[0]
+                if alpha < score < beta:
+                    score = -self._negamax(
+                        position, depth - 1, -beta, -alpha, opponent, 1
+                    )[0]
+            else:
+                score = -self._negamax(
+                    position, depth - 1, -beta, -alpha, opponent, 1
+                )[0]
+        finally:
+            self._unmake_move(position, move, undo)
+            self.deadline = None
+            self.node_limit = None
+            self.stoppable = True
+
+        self.principal_variation = [move] + self.pv_table[1]
+        return score
+
+    def _start_search(
+        self,
+        player: int,
+        evaluation_callback: Optional[Callable],
+        progress: Optional[SearchProgress],
+        age_history: bool = True,
+    ) -> None:
         self.nodes_visited = 0
+        self.interior_nodes = 0
+        self.leaf_nodes = 0
+        self.quiescence_nodes = 0
+        self.completed_depth = 0
+        self.cutoffs = 0
+        self.first_move_cutoffs = 0
+        self.aspiration_researches = 0
+        self.reductions = 0
+        self.reduction_researches = 0
+        self.futility_prunes = 0
+        # The evaluator weights can change between searches, as they do
+        # for each engine in a weight match
+        self.futility_margins = self._futility_margins()
+        self.principal_variation = []
+        self.move_orderer.new_search(age_history)
         self.evaluation_callback = evaluation_callback
-        self.move_evaluation_callback = move_evaluation_callback
+        self.progress = progress
+        self.search_stats = SearchStats(self.instrument)
+        self._bind_phases()
+
+        # Stored scores are relative to the side to move, which is part of
+        # the hash, so the table stays valid whichever side searches
+        self.transposition_table.reset_stats()
+
+    def _bind_phases(self) -> None:
+        # The search calls these through the instance, which costs the same
+        # as calling them directly, so timing is free while it is off
+        generate_moves = MoveValidator.get_all_valid_moves_bitboard
+        generate_tactical_moves = MoveValidator.get_tactical_moves_bitboard
+        evaluate = PositionEvaluator.evaluate_bitboard
+        make_move = BitboardState.make_move
+        unmake_move = BitboardState.unmake_move
+
+        if self.instrument:
+            timer = self.search_stats.timer
+            generate_moves = timer("move_generation", generate_moves)
+            generate_tactical_moves = timer("move_generation", generate_tactical_moves)
+            evaluate = timer("evaluation", evaluate)
+            make_move = timer("make_unmake", make_move)
+            unmake_move = timer("make_unmake", unmake_move)
 
-        return self._minimax(state, depth, float("-inf"), float("inf"), True, player)
+        self._generate_moves = generate_moves
+        self._generate_tactical_moves = generate_tactical_moves
+        self._evaluate = evaluate
+        self._make_move = make_move
+        self._unmake_move = unmake_move
 
-    def _minimax(
+    def _aspiration_search(
         self,
-        state: GameState,
+        position: BitboardState,
+        depth: int,
+        player: int,
+        previous_score: Optional[float],
+    ) -> Tuple[float, Optional[Move]]:
+        if previous_score is None or abs(previous_score) >= self.PROVEN_SCORE:
+            return self._negamax(position, depth, float("-inf"), float("inf"), player)
+
+        window = self.ASPIRATION_WINDOW
+        alpha = previous_score - window
+        beta = previous_score + window
+
+        while True:
+            score, move = self._negamax(position, depth, alpha, beta, player)
+            if alpha < score < beta:
+                return score, move
+
+            # Outside the window the score is only a bound; widen that side
+            # past it, giving up on a window once a win is in range
+            self.aspiration_researches += 1
+            window *= 4
+            if score <= alpha:
+                alpha = score - window
+                if alpha <= -self.PROVEN_SCORE:
+                    alpha = float("-inf")
+            else:
+                beta = score + window
+                if beta >= self.PROVEN_SCORE:
+                    beta = float("inf")
+
+    def _negamax(
+        self,
+        state: BitboardState,
         depth: int,
         alpha: float,
         beta: float,
-        maximizing: bool,
-        original_player: int,
-    ) -> Tuple[float, Optional[Tuple[Tuple[int, int], Tuple[int, int]]]]:
+        player: int,
+        ply: int = 0,
+    ) -> Tuple[float, Optional[Move]]:
+        """Principal variation search; scores are from player's point of view.
+
+        player is the side to move. It is passed down rather than read from
+        the state because a winning move leaves current_player unchanged.
+        """
         self.nodes_visited += 1
+        if (
+            self.node_limit is not None
+            and self.nodes_visited + self.quiescence_nodes > self.node_limit
+        ):
+            raise SearchTimeout()
+
+        if self.nodes_visited % self.TIME_CHECK_INTERVAL == 0:
+            if self.progress is not None:
+                self.progress.nodes = self.nodes_visited + self.quiescence_nodes
+            if self._out_of_time():
+                raise SearchTimeout()
+
+        # Wider than a null window: this node can still be on the PV
+        pv_node = beta - alpha > 1
+        if pv_node and ply < MoveOrderer.MAX_PLY:
+            self.pv_table[ply] = []
 
-        if depth == 0 or GameRules.is_game_over(state):
-            evaluation = PositionEvaluator.evaluate(
-                state, original_player, self.human_player
-            )
+        if state.winner is not None:
+            evaluation = self._from_node(self._evaluate(state, player), ply)
+            return self._terminal(evaluation), None
+
+        # A side with no move has lost. Interior nodes learn that from the
+        # move list they generate anyway; leaves ask the bitmasks
+        if depth == 0 and not MoveValidator.has_valid_moves_bitboard(state, player):
+            return self._terminal(-(PositionEvaluator.WIN_VALUE - ply)), None
+
+        # Leaves get the same check through the evaluation
+        if depth > 0 and ply > 0:
+            forced = GameRules.get_forced_result_bitboard(state)
+            if forced:
+                score = PositionEvaluator.WIN_VALUE - ThreatDetector.plies_to_result(
+                    forced
+                )
+                return self._from_node(score if forced > 0 else -score, ply), None
+
+        if depth == 0:
+            self.leaf_nodes += 1
+            self.quiescence_budget_left = self.quiescence_budget
+            evaluation = self._quiescence(state, alpha, beta, player, ply)
             if self.evaluation_callback:
                 self.evaluation_callback(evaluation)
             return evaluation, None
 
-        current_player = state.current_player
-        valid_moves = MoveValidator.get_all_valid_moves(state, current_player)
+        alpha_orig = alpha
+        beta_orig = beta
+        tt_move = None
+
+        entry = self.transposition_table.probe(state.hash)
+        if entry is not None:
+            _, tt_depth, tt_score, tt_bound, tt_move = entry
+            tt_score = self._from_node(tt_score, ply)
+
+            # PV nodes always search, so the full line can be collected
+            if tt_depth >= depth and not pv_node:
+                if tt_bound == EXACT:
+                    return tt_score, tt_move
+                elif tt_bound == LOWER_BOUND:
+                    alpha = max(alpha, tt_score)
+                else:
+                    beta = min(beta, tt_score)
+
+                if beta <= alpha:
+                    return tt_score, tt_move
+
+        valid_moves = self._generate_moves(state, player)
 
         if not valid_moves:
-            evaluation = PositionEvaluator.evaluate(
-                state, original_player, self.human_player
-            )
-            return evaluation, None
+            return self._terminal(-(PositionEvaluator.WIN_VALUE - ply)), None
 
+        self.interior_nodes += 1
+        valid_moves = self.move_orderer.order_moves(state, valid_moves, ply, tt_move)
+
+        opponent = GameRules.get_opponent(player)
+        best_score = float("-inf")
         best_move = None
 
-        if maximizing:
-            max_eval = float("-inf")
+        reduce_late = self.late_move_reductions and depth >= self.LMR_MIN_DEPTH
+        futility_score = self._futility_score(state, depth, alpha, player, pv_node)
+        if reduce_late or futility_score is not None:
+            zone = state.goal_zone_mask(player)
+            cones = CONE_MASKS[player]
+            enemy = state.pieces(opponent)
 
-            for move in valid_moves:
-                if self.move_evaluation_callback:
-                    self.move_evaluation_callback(move[0], move[1])
+        for index, move in enumerate(valid_moves):
+            if ply == 0 and self.progress is not None:
+                self.progress.root_move = move
 
-                next_state = state.copy()
-                GameRules.execute_move(next_state, move[0], move[1], self.human_player)
+            quiet = self.move_orderer.is_quiet(move)
 
-                eval_score, _ = self._minimax(
-                    next_state, depth - 1, alpha, beta, False, original_player
-                )
+            # Only quiet moves are cut short, and never one onto the last
+            # two rows or one that leaves no enemy piece ahead of the mover
+            reduction = 0
+            if index and quiet and (reduce_late or futility_score is not None):
+                to_sq = move_to(move)
+                if not (zone >> to_sq) & 1 and cones[to_sq] & enemy:
+                    if futility_score is not None:
+                        self.futility_prunes += 1
+                        best_score = max(best_score, futility_score)
+                        continue
+                    if index >= self.LMR_FULL_DEPTH_MOVES:
+                        reduction = self.LMR_REDUCTION
 
-                if eval_score > max_eval:
-                    max_eval = eval_score
-                    best_move = move
+            undo = self._make_move(state, move)
 
-                # Update alpha
-                alpha = max(alpha, eval_score)
+            if index == 0:
+                score = -self._negamax(
+                    state, depth - 1, -beta, -alpha, opponent, ply + 1
+                )[0]
+            else:
+                # Prove the move is no better than alpha with a null window
+                # (a non-PV node's window already is one), and only pay for
+                # a full-depth or full-window search when that fails high
+                scout_beta = alpha + 1 if pv_node else beta
+                score = -self._negamax(
+                    state, depth - 1 - reduction, -scout_beta, -alpha, opponent, ply + 1
+                )[0]
+                if reduction:
+                    self.reductions += 1
+                    if score > alpha:
+                        self.reduction_researches += 1
+                        score = -self._negamax(
+                            state, depth - 1, -scout_beta, -alpha, opponent, ply + 1
+                        )[0]
+                if pv_node and alpha < score < beta:
+                    score = -self._negamax(
+                        state, depth - 1, -beta, -alpha, opponent, ply + 1
+                    )[0]
 
-                # Beta cutoff
-                if beta <= alpha:
-                    break
+            self._unmake_move(state, move, undo)
 
-            return max_eval, best_move
+            if score > best_score:
+                best_score = score
+                best_move = move
 
+                if score > alpha:
+                    alpha = score
+                    if pv_node and score < beta and ply < MoveOrderer.MAX_PLY:
+                        self.pv_table[ply] = [move] + self.pv_table[ply + 1]
+
+            if alpha >= beta:
+                self._record_cutoff(move, index, quiet, depth, ply)
+                break
+
+        self._store(state, depth, ply, best_score, alpha_orig, beta_orig, best_move)
+        return best_score, best_move
+
+    def _futility_score(
+        self,
+        state: BitboardState,
+        depth: int,
+        alpha: float,
+        player: int,
+        pv_node: bool,
+    ) -> Optional[float]:
+        """The most a quiet move could score here, if that is below alpha.
+
+        None when futility pruning doesn't apply: it is off, the node is on
+        the PV or too far from the leaves, or a result is proven.
+        """
+        if (
+            not self.futility_pruning
+            or pv_node
+            or depth >= len(self.futility_margins)
+            or not -self.PROVEN_SCORE < alpha < self.PROVEN_SCORE
+        ):
+            return None
+
+        evaluation = self._evaluate(state, player)
+        if abs(evaluation) >= self.PROVEN_SCORE:
+            return None
+        score = evaluation + self.futility_margins[depth]
+        return score if score <= alpha else None
+
+    @staticmethod
+    def _futility_margins() -> Tuple[float, ...]:
+        # Margins by remaining depth, in evaluator points. At depth 1 a
+        # quiet move is worth a row of advancement and some mobility; by
+        # depth 2 the side to move also gets a capture in before the leaf
+        quiet = (
+            PositionEvaluator.ADVANCEMENT_VALUE + 8 * PositionEvaluator.MOBILITY_VALUE
+        )
+        return (0, quiet, PositionEvaluator.MATERIAL_VALUE + quiet)
+
+    @classmethod
+    def _from_node(cls, score: float, ply: int) -> float:
+        """A score counted from this node, as the evaluation and the
+        transposition table give it, counted from the root instead."""
+        if score >= cls.PROVEN_SCORE:
+            return max(score - ply, cls.PROVEN_SCORE)
+        if score <= -cls.PROVEN_SCORE:
+            return min(score + ply, -cls.PROVEN_SCORE)
+        return score
+
+    @classmethod
+    def _to_node(cls, score: float, ply: int) -> float:
+        if score >= cls.PROVEN_SCORE:
+            return score + ply
+        if score <= -cls.PROVEN_SCORE:
+            return score - ply
+        return score
+
+    def _terminal(self, evaluation: float) -> float:
+        if self.evaluation_callback:
+            self.evaluation_callback(evaluation)
+        return evaluation
+
+    def _quiescence(
+        self,
+        state: BitboardState,
+        alpha: float,
+        beta: float,
+        player: int,
+        ply: int,
+    ) -> float:
+        """Resolve captures and breakthroughs before trusting the evaluation.
+
+        The side to move may stand pat on the static evaluation instead of
+        making a tactical move, unless an enemy piece is about to break
+        through. Once the leaf's node budget is spent, every remaining node
+        stands pat.
+        """
+        if self.quiescence_budget_left <= 0:
+            return self._from_node(self._evaluate(state, player), ply)
+        self.quiescence_budget_left -= 1
+        self.quiescence_nodes += 1
+        if (
+            self.node_limit is not None
+            and self.nodes_visited + self.quiescence_nodes > self.node_limit
+        ):
+            raise SearchTimeout()
+
+        if self.quiescence_nodes % self.TIME_CHECK_INTERVAL == 0:
+            if self.progress is not None:
+                self.progress.nodes = self.nodes_visited + self.quiescence_nodes
+            if self._out_of_time():
+                raise SearchTimeout()
+
+        opponent = GameRules.get_opponent(player)
+
+        if state.winner is None and (
+            state.pieces(opponent) & state.goal_zone_mask(opponent)
+        ):
+            # An enemy runner one step from home wins next move unless it
+            # is captured now, so standing pat is not an option; the ply
+            # keeps nearer losses worse than farther ones
+            stand_pat = -(PositionEvaluator.WIN_VALUE - ply)
         else:
-            min_eval = float("inf")
+            stand_pat = self._evaluate(state, player)
+            if abs(stand_pat) >= self.PROVEN_SCORE:
+                return self._from_node(stand_pat, ply)
+            if stand_pat >= beta:
+                return stand_pat
+        alpha = max(alpha, stand_pat)
 
-            for move in valid_moves:
-                if self.move_evaluation_callback:
-                    self.move_evaluation_callback(move[0], move[1])
+        moves = self._generate_tactical_moves(state, player)
+        if not moves:
+            return stand_pat
+        moves = self.move_orderer.order_moves(state, moves, ply)
 
-                next_state = state.copy()
-                GameRules.execute_move(next_state, move[0], move[1], self.human_player)
+        best_score = stand_pat
 
-                eval_score, _ = self._minimax(
-                    next_state, depth - 1, alpha, beta, True, original_player
-                )
+        for move in moves:
+            undo = self._make_move(state, move)
+            score = -self._quiescence(state, -beta, -alpha, opponent, ply + 1)
+            self._unmake_move(state, move, undo)
 
-                if eval_score < min_eval:
-                    min_eval = eval_score
-                    best_move = move
+            if score > best_score:
+                best_score = score
+                if score > alpha:
+                    alpha = score
+                    if alpha >= beta:
+                        break
 
-                # Update beta
-                beta = min(beta, eval_score)
+        return best_score
 
-                # Alpha cutoff
-                if beta <= alpha:
-                    break
+    def stop(self) -> None:
+        """Abandon the running search; it returns its deepest completed result.
+
+        The flag stays set until the caller clears stop_requested, so a stop
+        that arrives before the search starts is not lost.
+        """
+        self.stop_requested = True
+
+    def new_game(self) -> None:
+        """Forget what earlier games taught the tables."""
+        self.transposition_table.clear()
+        self.move_orderer = MoveOrderer()
+
+    def _out_of_time(self) -> bool:
+        if self.stoppable and (
+            self.stop_requested
+            or (self.stop_event is not None and self.stop_event.is_set())
+        ):
+            return True
+        return self.deadline is not None and time.perf_counter() >= self.deadline
+
+    def _record_cutoff(
+        self,
+        move: Move,
+        index: int,
+        quiet: bool,
+        depth: int,
+        ply: int,
+    ) -> None:
+        self.cutoffs += 1
+        if index == 0:
+            self.first_move_cutoffs += 1
+        if quiet:
+            self.move_orderer.record_cutoff(move, depth, ply)
 
-            return min_eval, best_move
+    def _store(
+        self,
+        state: BitboardState,
+        depth: int,
+        ply: int,
+        score: float,
+        alpha: float,
+        beta: float,
+        best_move: Optional[Move],
+    ) -> None:
+        if score <= alpha:
+            bound = UPPER_BOUND
+        elif score >= beta:
+            bound = LOWER_BOUND
+        else:
+            bound = EXACT
+
+        # Proven results are stored counted from this node, so they stay
+        # right when the position is reached at another ply
+        self.transposition_table.store(
+            state.hash, depth, self._to_node(score, ply), bound, best_move
+        )
 
     def get_nodes_visited(self) -> int:
         return self.nodes_visited
+
+    def get_quiescence_nodes(self) -> int:
+        return self.quiescence_nodes
+
+    def get_first_move_cutoff_rate(self) -> float:
+        return self.first_move_cutoffs / self.cutoffs if self.cutoffs else 0.0
+
+    def set_instrumentation(self, enabled: bool) -> None:
+        """Time move generation, evaluation and make/unmake from the next search."""
+        self.instrument = enabled
+
+    def get_search_stats(self) -> dict:
+        """Per-depth counters of the last search, with phase times if timed."""
+        return self.search_stats.to_dict()
+
+    def get_counters(self) -> dict:
+        table = self.transposition_table
+        return {
+            "nodes": self.nodes_visited,
+            "interior_nodes": self.interior_nodes,
+            "leaf_nodes": self.leaf_nodes,
+            "quiescence_nodes": self.quiescence_nodes,
+            "cutoffs": self.cutoffs,
+            "first_move_cutoffs": self.first_move_cutoffs,
+            "aspiration_researches": self.aspiration_researches,
+            "reductions": self.reductions,
+            "reduction_researches": self.reduction_researches,
+            "futility_prunes": self.futility_prunes,
+            "tt_probes": table.probes,
+            "tt_hits": table.hits,
+        }
+
+    def get_tt_stats(self) -> dict:
+        return {
+            "tt_hit_rate": self.transposition_table.hit_rate(),
+            "tt_fill": self.transposition_table.fill_level(),
+        }
@@ -1,64 +1,227 @@
-import math
+import queue
 import time
 
-from PyQt6.QtCore import QThread, pyqtSignal
+from PyQt6.QtCore import QThread, QTimer, pyqtSignal
 
 from controller.ai_algorithm import MinimaxAlgorithm
-from model import GameState
+from controller.parallel_search import ParallelSearch
+from controller.progress import SearchProgress
+from model import GameState, decode_move, decode_moves
 
 
 class AIController(QThread):
-    move_decided = pyqtSignal(tuple, tuple)  # (from_pos, to_pos)
-    thinking_update = pyqtSignal(tuple, tuple)
-    metrics_update = pyqtSignal(dict)
-
-    def __init__(
-        self, state: GameState, player: int, depth: int = 3, human_player: int = None
-    ):
+    """The AI's engine thread, started once and kept for the whole session.
+
+    The GUI thread sends it commands through a queue: search, new game and
+    set options, run one at a time in order. Each search belongs to the
+    generation it was requested in. stop() and new_game() move to a new
+    generation and abort the running search at its next clock check;
+    queued searches from an old generation are skipped, and results carry
+    their generation so the GUI can drop any that were already in flight.
+    """
+
+    move_decided = pyqtSignal(int, tuple, tuple)  # (generation, from, to)
+    metrics_update = pyqtSignal(int, dict)  # (generation, metrics)
+    progress_update = pyqtSignal(dict)
+    search_finished = pyqtSignal(int)  # generation
+
+    SEARCH = "search"
+    NEW_GAME = "new_game"
+    SET_OPTIONS = "set_options"
+    QUIT = "quit"
+
+    # Progress is sampled at 20 Hz, however fast the search runs
+    PROGRESS_INTERVAL_MS = 50
+
+    def __init__(self, algorithm: MinimaxAlgorithm = None):
         super().__init__()
 
-        self.state = state.copy()
-        self.player = player
-        self.depth = depth
-        self.human_player = human_player
-
-        self.algorithm = MinimaxAlgorithm(human_player)
-        self.start_time = 0
-        self.branching_factor = 0
+        # A shared engine keeps its tables from earlier turns
+        self.algorithm = algorithm or MinimaxAlgorithm()
+        self.commands = queue.Queue()
+
+        # Only the GUI thread moves the generation on; the worker compares
+        self.generation = 0
+        self.running_generation = None
+        self.active_search = None
+
+        # Options, applied by the worker between searches
+        self.depth = 3
+        self.time_limit = None
+        self.parallel_search = None
+
+        # The timer lives in the GUI thread and samples the snapshot the
+        # search thread writes, so one update goes out per tick
+        self.progress = SearchProgress()
+        self.last_progress = None
+        self.progress_timer = QTimer()
+        self.progress_timer.setInterval(self.PROGRESS_INTERVAL_MS)
+        self.progress_timer.timeout.connect(self._emit_progress)
+        self.search_finished.connect(self._on_search_finished)
+
+    # Commands, called from the GUI thread
+
+    def search(self, state: GameState, player: int, time_spent: float = 0.0) -> int:
+        """Queue a search for player's move and return its generation.
+
+        time_spent is time this controller's engine already spent pondering
+        the move. It comes off a timed search's budget, and the search stays
+        on that engine rather than the parallel pool, whose workers never
+        saw the pondered tables.
+        """
+        self.last_progress = None
+        self.progress_timer.start()
+        self.commands.put(
+            (self.SEARCH, self.generation, (state.copy(), player, time_spent))
+        )
+        return self.generation
+
+    def stop(self) -> int:
+        """Abandon the running search and any queued ones."""
+        self.generation += 1
+        self.progress_timer.stop()
+
+        # The worker clears the flag before it checks the generation, so
+        # whichever side gets here first, the stale search is abandoned
+        search = self.active_search
+        if search is not None:
+            search.stop()
+        return self.generation
+
+    def new_game(self) -> int:
+        generation = self.stop()
+        self.commands.put((self.NEW_GAME, generation, None))
+        return generation
+
+    def set_options(
+        self,
+        depth: int = 3,
+        time_limit: float = None,
+        parallel_search: ParallelSearch = None,
+    ):
+        options = {
+            "depth": depth,
+            "time_limit": time_limit,
+            "parallel_search": parallel_search,
+        }
+        self.commands.put((self.SET_OPTIONS, self.generation, options))
+
+    def shutdown(self):
+        # A stopped search gives up within one clock check, so this never
+        # waits for a deep search to finish
+        self.stop()
+        self.commands.put((self.QUIT, self.generation, None))
+        self.wait()
+
+    # Worker thread
 
     def run(self):
-        self.start_time = time.time()
-
-        best_score, best_move = self.algorithm.find_best_move(
-            self.state,
-            self.player,
-            self.depth,
-            evaluation_callback=None,
-            move_evaluation_callback=self._on_move_evaluation,
+        while True:
+            command, generation, args = self.commands.get()
+
+            if command == self.QUIT:
+                return
+            if command == self.SET_OPTIONS:
+                self.depth = max(1, min(args["depth"], 6))
+                self.time_limit = args["time_limit"]
+                self.parallel_search = args["parallel_search"]
+            elif command == self.NEW_GAME:
+                self.algorithm.new_game()
+            elif command == self.SEARCH:
+                self._search(generation, *args)
+
+    def _search(
+        self, generation: int, state: GameState, player: int, time_spent: float
+    ):
+        if time_spent:
+            search = self.algorithm
+        else:
+            search = self.parallel_search or self.algorithm
+        self.active_search = search
+        search.stop_requested = False
+        if generation != self.generation:
+            self.active_search = None
+            return
+
+        self.progress.reset()
+        self.running_generation = generation
+        start_time = time.time()
+
+        time_limit = self.time_limit
+        if time_limit is not None:
+            time_limit -= time_spent
+            max_depth = MinimaxAlgorithm.MAX_TIMED_DEPTH
+            soft_time_limit = time_limit * MinimaxAlgorithm.SOFT_LIMIT_FRACTION
+        else:
+            max_depth = self.depth
+            soft_time_limit = None
+
+        # With nobody listening the search doesn't write a snapshot at all
+        progress = self.progress if self.receivers(self.progress_update) else None
+
+        best_score, best_move = search.iterative_deepening(
+            state,
+            player,
+            max_depth,
+            soft_time_limit=soft_time_limit,
+            hard_time_limit=time_limit,
+            progress=progress,
         )
-
-        execution_time = time.time() - self.start_time
-        nodes_visited = self.algorithm.get_nodes_visited()
-
-        if self.depth > 0 and nodes_visited > 1:
-            self.branching_factor = math.pow(nodes_visited, 1.0 / self.depth)
+        if search is self.parallel_search:
+            search_metrics = {"workers": search.workers}
+        else:
+            search_metrics = {
+                "first_move_cutoff_rate": search.get_first_move_cutoff_rate()
+            }
+
+        self.active_search = None
+        self.running_generation = None
+        self.search_finished.emit(generation)
+        if generation != self.generation:
+            return
+
+        execution_time = time.time() - start_time
+        search_stats = search.get_search_stats()
 
         self._emit_metrics(
-            depth=self.depth,
-            nodes_visited=nodes_visited,
+            generation,
+            depth=search.completed_depth,
+            nodes_visited=search.get_nodes_visited(),
+            quiescence_nodes=search.get_quiescence_nodes(),
             execution_time=execution_time,
-            branching_factor=self.branching_factor,
+            branching_factor=search_stats["effective_branching_factor"],
+            search_stats=search_stats,
             evaluation=best_score,
+            principal_variation=decode_moves(search.principal_variation),
+            time_limit=time_limit,
+            **search_metrics,
+            **search.get_tt_stats(),
         )
 
-        if best_move:
-            self.move_decided.emit(best_move[0], best_move[1])
-
-    def _on_move_evaluation(self, from_pos: tuple, to_pos: tuple):
-        self.thinking_update.emit(from_pos, to_pos)
+        # Last, so the engine is free by the time the GUI sees the move
+        if best_move is not None:
+            from_pos, to_pos = decode_move(best_move)
+            self.move_decided.emit(generation, from_pos, to_pos)
+
+    def _emit_progress(self):
+        if self.running_generation != self.generation:
+            return
+        snapshot = self.progress.snapshot()
+        if snapshot["root_move"] is None or snapshot == self.last_progress:
+            return
+        self.last_progress = snapshot
+
+        # The engine's moves are encoded; the GUI gets (row, col) pairs
+        progress = dict(snapshot)
+        progress["root_move"] = decode_move(snapshot["root_move"])
+        progress["principal_variation"] = decode_moves(
+            snapshot["principal_variation"]
+        )
+        self.progress_update.emit(progress)
 
-    def _emit_metrics(self, **metrics):
-        self.metrics_update.emit(metrics)
+    def _on_search_finished(self, generation: int):
+        if generation == self.generation:
+            self.progress_timer.stop()
 
-    def set_depth(self, depth: int):
-        self.depth = max(1, min(depth, 6))
+    def _emit_metrics(self, generation: int, **metrics):
+        self.metrics_update.emit(generation, metrics)
@@ -0,0 +1,136 @@
+import time
+from typing import Callable, Optional, Tuple
+
+from controller.move_ordering import MoveOrderer
+from controller.progress import SearchProgress
+from model import GameState, Move, PositionEvaluator
+
+
+class SearchTimeout(Exception):
+    pass
+
+
+class IterativeDeepening:
+    """The depth-by-depth driver shared by the serial and parallel searches.
+
+    Subclasses start a search in _start_deepening and search one depth in
+    _search_depth, keeping search_stats, principal_variation and
+    completed_depth up to date, and have a stop_requested flag.
+    """
+
+    # A proven result scores WIN_VALUE less the plies to reach it from the
+    # root, so faster wins and slower losses score higher. Anything at
+    # least this far from zero is proven
+    PROVEN_SCORE = PositionEvaluator.WIN_VALUE - MoveOrderer.MAX_PLY
+
+    def iterative_deepening(
+        self,
+        state: GameState,
+        player: int,
+        max_depth: int,
+        soft_time_limit: Optional[float] = None,
+        hard_time_limit: Optional[float] = None,
+        evaluation_callback: Optional[Callable] = None,
+        progress: Optional[SearchProgress] = None,
+        iteration_callback: Optional[Callable] = None,
+        node_limit: Optional[int] = None,
+    ) -> Tuple[float, Optional[Move]]:
+        """Search depth 1, 2, ... until max_depth or the time budget runs out.
+
+        No new iteration starts after soft_time_limit seconds, and an
+        iteration still running at hard_time_limit is abandoned. node_limit
+        caps main and quiescence nodes together the same way, and no
+        iteration that passes it is kept. Depth 1 ignores all three, and
+        stop requests too, so there is always a move to play. The result
+        always comes from the deepest completed iteration. Each iteration
+        searches the previous principal variation first inside an
+        aspiration window. Scores swing between odd and even depths, so the
+        window is centred on the last iteration that had the same parity.
+        A progress snapshot, if given, is kept up to date for another
+        thread to sample.
+
+        Moves, here and in principal_variation, are encoded ints; callers
+        outside the engine decode them with model.decode_move.
+        """
+        self._start_deepening(state, player, evaluation_callback, progress)
+        start_time = time.perf_counter()
+
+        best_score, best_move = float("-inf"), None
+        scores = {}
+
+        for depth in range(1, max_depth + 1):
+            # A stop that came during depth 1 ends the search after it;
+            # one that comes later ends the iteration it interrupts
+            limited = depth > 1
+            if limited and self.stop_requested:
+                break
+            deadline = None
+            if limited and hard_time_limit is not None:
+                deadline = start_time + hard_time_limit
+
+            if progress is not None:
+                progress.start_iteration(depth)
+            self.search_stats.start_iteration(self.get_counters())
+            try:
+                score, move = self._search_depth(
+                    depth,
+                    player,
+                    scores.get(depth - 2),
+                    deadline,
+                    node_limit if limited else None,
+                    stoppable=limited,
+                )
+            except SearchTimeout:
+                self.search_stats.finish_iteration(
+                    depth, self.get_counters(), completed=False
+                )
+                break
+            self.search_stats.finish_iteration(depth, self.get_counters())
+
+            best_score, best_move = score, move
+            scores[depth] = score
+            self.completed_depth = depth
+            if progress is not None:
+                progress.finish_iteration(depth, score, self.principal_variation)
+
+            if iteration_callback:
+                iteration_callback(depth, best_score, best_move)
+
+            elapsed = time.perf_counter() - start_time
+            if soft_time_limit is not None and elapsed >= soft_time_limit:
+                break
+            if node_limit is not None and self._nodes_searched() >= node_limit:
+                break
+
+            # A won or lost position won't change with more depth
+            if abs(best_score) >= self.PROVEN_SCORE:
+                break
+
+        return best_score, best_move
+
+    def _start_deepening(
+        self,
+        state: GameState,
+        player: int,
+        evaluation_callback: Optional[Callable],
+        progress: Optional[SearchProgress],
+    ) -> None:
+        raise NotImplementedError
+
+    def _search_depth(
+        self,
+        depth: int,
+        player: int,
+        expected_score: Optional[float],
+        deadline: Optional[float],
+        node_limit: Optional[int],
+        stoppable: bool,
+    ) -> Tuple[float, Optional[Move]]:
+        """One iteration; raises SearchTimeout if it is abandoned.
+
+        deadline is on the perf_counter clock.
+        """
+        raise NotImplementedError
+
+    def _nodes_searched(self) -> int:
+        return self.get_nodes_visited() + self.get_quiescence_nodes()
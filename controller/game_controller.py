@@ -1,14 +1,21 @@
+import os
 import random
 
 from PyQt6.QtCore import QTimer
 from PyQt6.QtWidgets import QMessageBox
 
+from controller.ai_algorithm import MinimaxAlgorithm
 from controller.ai_controller import AIController
+from controller.parallel_search import ParallelSearch
+from controller.ponder_controller import PonderController
 from model import GameRules, GameState, MoveValidator
 from view import GameWindow, DifficultyDialog
 
 
 class GameController:
+    # Shallow searches finish faster than the pool can hand out work
+    PARALLEL_MIN_DEPTH = 5
+
     def __init__(self):
         self.game_state = None
 
@@ -17,7 +24,15 @@ class GameController:
         self.human_player = None
         self.ai_player = None
         self.ai_depth = 3
-        self.ai_thread = None
+        self.ai_time_limit = None
+        self.parallel_search = None
+        # One engine for the whole session, so its transposition table and
+        # history survive from move to move and are filled while pondering
+        self.engine = MinimaxAlgorithm()
+        self.ai_thread = AIController(self.engine)
+        self.ai_generation = None
+        self.ponder_thread = None
+        self.expected_line = []
         self.selected_piece = None
         self.game_started = False
 
@@ -30,14 +45,26 @@ class GameController:
 
         self.window.new_game_requested.connect(self._start_new_game)
 
+        self.ai_thread.progress_update.connect(self._on_ai_progress)
+        self.ai_thread.metrics_update.connect(self._on_ai_metrics)
+        self.ai_thread.move_decided.connect(self._on_ai_move)
+        self.ai_thread.start()
+
     def show(self):
         self.window.show()
 
+    def shutdown(self):
+        self._stop_pondering()
+        self.ai_thread.shutdown()
+        if self.parallel_search is not None:
+            self.parallel_search.shutdown()
+
     def _start_new_game(self):
         # Show difficulty selection dialog
         dialog = DifficultyDialog(self.window)
         if dialog.exec():
             self.ai_depth = dialog.get_selected_depth()
+            self.ai_time_limit = dialog.get_selected_time_limit()
             self._update_difficulty_display()
         else:
             # If dialog was cancelled, don't start a new game
@@ -46,6 +73,18 @@ class GameController:
                 self.window.close()
             return
         
+        # Anything still searching or queued belongs to the old game
+        self._stop_pondering()
+        self.ai_thread.new_game()
+        if self.parallel_search is not None:
+            self.parallel_search.new_game()
+        self.ai_thread.set_options(
+            depth=self.ai_depth,
+            time_limit=self.ai_time_limit,
+            parallel_search=self._get_parallel_search(),
+        )
+        self.ai_generation = None
+        self.expected_line = []
         self.selected_piece = None
         self.game_started = True
 
@@ -61,12 +100,13 @@ class GameController:
             self.window.metrics_panel.set_status("AI Thinking...", "#FFB347")
         
         self.game_state = GameState()
-        GameRules.setup_initial_position(self.game_state, self.human_player)
-        self.game_state.human_player = self.human_player
+        GameRules.setup_initial_position(self.game_state)
         
         if self.human_player == GameState.BLACK:
             QTimer.singleShot(500, self._trigger_ai_move)
 
+        # The model keeps White at the top; show the human's side at the bottom
+        self.window.board_view.set_flipped(self.human_player == GameState.WHITE)
         self.window.board_view.update_board(self.game_state.board)
         self.window.board_view.clear_highlights()
         self.window.metrics_panel.reset_metrics()
@@ -98,7 +138,7 @@ class GameController:
         from_pos = self.selected_piece
         to_pos = (row, col)
 
-        if GameRules.execute_move(self.game_state, from_pos, to_pos, self.human_player):
+        if GameRules.execute_move(self.game_state, from_pos, to_pos):
             self.window.board_view.update_board(self.game_state.board)
             self.window.board_view.clear_highlights()
             self.window.board_view.show_last_move(from_pos, to_pos)
@@ -116,28 +156,101 @@ class GameController:
             self.window.board_view.clear_highlights()
 
     def _trigger_ai_move(self):
+        # Scheduled on a timer, so a new game may have started since
         if GameRules.is_game_over(self.game_state):
             return
+        if self.game_state.current_player != self.ai_player:
+            return
 
-        self.ai_thread = AIController(
-            self.game_state, self.ai_player, self.ai_depth, self.human_player
+        time_spent = 0.0
+        ponder = self._stop_pondering()
+        if ponder is not None and ponder.is_hit(self.game_state):
+            if self._play_pondered_move(ponder):
+                return
+            # Time spent pondering the right reply counts towards this move,
+            # which then runs on the engine holding the pondered tables
+            time_spent = ponder.elapsed
+
+        self.ai_generation = self.ai_thread.search(
+            self.game_state, self.ai_player, time_spent
         )
 
-        self.ai_thread.thinking_update.connect(self._on_ai_thinking)
-        self.ai_thread.metrics_update.connect(self._on_ai_metrics)
-        self.ai_thread.move_decided.connect(self._on_ai_move)
-
-        self.ai_thread.start()
-
-    def _on_ai_thinking(self, from_pos: tuple, to_pos: tuple):
-        if random.random() < 0.5:  # Show ~50% of evaluations
-            self.window.board_view.show_thinking(from_pos, to_pos)
-
-    def _on_ai_metrics(self, metrics: dict):
+    def _play_pondered_move(self, ponder: PonderController) -> bool:
+        if ponder.best_move is None:
+            return False
+        if self.ai_time_limit is not None:
+            if ponder.elapsed < self.ai_time_limit:
+                return False
+        elif ponder.completed_depth < self.ai_depth:
+            return False
+
+        self._show_metrics(
+            {
+                "depth": ponder.completed_depth,
+                "nodes_visited": ponder.nodes_visited,
+                "execution_time": 0.0,
+                "evaluation": ponder.best_score,
+                "principal_variation": ponder.principal_variation,
+                "pondered": True,
+            }
+        )
+        move = ponder.best_move
+        QTimer.singleShot(0, lambda: self._apply_ai_move(move[0], move[1]))
+        return True
+
+    def _start_pondering(self):
+        # The AI's expected line is its move, then the human's best reply
+        expected_reply = None
+        if len(self.expected_line) >= 2:
+            from_pos, to_pos = self.expected_line[1]
+            if MoveValidator.is_valid_move(self.game_state, from_pos, to_pos):
+                expected_reply = (from_pos, to_pos)
+
+        self.ponder_thread = PonderController(
+            self.game_state, self.engine, expected_reply
+        )
+        self.ponder_thread.start()
+
+    def _stop_pondering(self):
+        ponder = self.ponder_thread
+        if ponder is not None:
+            ponder.stop()
+            self.ponder_thread = None
+        return ponder
+
+    def _get_parallel_search(self):
+        if (os.cpu_count() or 1) < 2:
+            return None
+        if self.ai_time_limit is None and self.ai_depth < self.PARALLEL_MIN_DEPTH:
+            return None
+
+        # Created once and kept, so worker processes stay warm between moves
+        if self.parallel_search is None:
+            self.parallel_search = ParallelSearch()
+        return self.parallel_search
+
+    def _on_ai_progress(self, progress: dict):
+        from_pos, to_pos = progress["root_move"]
+        self.window.board_view.show_thinking(from_pos, to_pos)
+        self.window.metrics_panel.update_progress(progress)
+
+    def _on_ai_metrics(self, generation: int, metrics: dict):
+        if generation == self.ai_generation:
+            self._show_metrics(metrics)
+
+    def _show_metrics(self, metrics: dict):
+        self.expected_line = metrics.get("principal_variation") or []
         self.window.metrics_panel.update_metrics(metrics)
 
-    def _on_ai_move(self, from_pos: tuple, to_pos: tuple):
-        if GameRules.execute_move(self.game_state, from_pos, to_pos, self.human_player):
+    def _on_ai_move(self, generation: int, from_pos: tuple, to_pos: tuple):
+        # A search from before a new game can finish after it started
+        if generation != self.ai_generation:
+            return
+        self.ai_generation = None
+        self._apply_ai_move(from_pos, to_pos)
+
+    def _apply_ai_move(self, from_pos: tuple, to_pos: tuple):
+        if GameRules.execute_move(self.game_state, from_pos, to_pos):
             self.window.board_view.update_board(self.game_state.board)
             self.window.board_view.clear_highlights()
             self.window.board_view.show_last_move(from_pos, to_pos)
@@ -147,9 +260,11 @@ class GameController:
             else:
                 self.window.set_info_text("Your turn!")
                 self.window.metrics_panel.set_status("Your Turn", "#90EE90")
+                self._start_pondering()
 
     def _handle_game_over(self):
-        winner = self.game_state.get_winner()
+        self._stop_pondering()
+        winner = GameRules.get_winner(self.game_state)
 
         if winner == self.human_player:
             message = "Congratulations! You won!"
@@ -171,6 +286,16 @@ class GameController:
 
     def _update_difficulty_display(self):
         """Update the difficulty display based on current AI depth"""
+        if self.ai_time_limit is not None:
+            self.window.depth_label.setText("Timed")
+            self.window.depth_label.setStyleSheet(
+                "color: #87CEEB; font-size: 24px; font-weight: bold; padding: 10px;"
+            )
+            self.window.depth_info.setText(
+                f"Time Limit: {self.ai_time_limit:g}s per move"
+            )
+            return
+
         if self.ai_depth == 1:
             difficulty_name = "Easy"
             difficulty_color = "#90EE90"
@@ -0,0 +1,86 @@
+from typing import List, Optional
+
+from model import BitboardState, Move
+from model.moves import CAPTURE_FLAG, FROM_TO_MASK, TO_SHIFT
+
+
+class MoveOrderer:
+    """Ranks moves so alpha-beta sees the likely refutation first.
+
+    Order: transposition-table move, immediate wins, captures (most
+    advanced victim first), the two killer moves for the ply, then quiet
+    moves by history score. Killers are encoded moves and history is
+    indexed by a move's from and to squares, so neither builds keys.
+    """
+
+    TT_MOVE_SCORE = 1 << 30
+    WIN_SCORE = 1 << 29
+    CAPTURE_SCORE = 1 << 28
+    KILLER_SCORE = 1 << 27
+
+    MAX_PLY = 64
+    KILLERS_PER_PLY = 2
+
+    def __init__(self):
+        self.killers = [[None] * self.KILLERS_PER_PLY for _ in range(self.MAX_PLY)]
+        self.history = [0] * (64 * 64)
+
+    def new_search(self, age_history: bool = True) -> None:
+        for slots in self.killers:
+            for i in range(self.KILLERS_PER_PLY):
+                slots[i] = None
+
+        # Keep history between searches but let old evidence fade
+        if age_history:
+            history = self.history
+            for i in range(len(history)):
+                history[i] >>= 1
+
+    def order_moves(
+        self,
+        position: BitboardState,
+        moves: List[Move],
+        ply: int,
+        tt_move: Optional[Move] = None,
+    ) -> List[Move]:
+        player = position.current_player
+        goal = position.goal_row_mask(player)
+        # The victim moves the other way: White's victims move up
+        victim_moves_down = not position.moves_down(player)
+        killers = self.killers[ply] if ply < self.MAX_PLY else ()
+        history = self.history
+
+        scores = []
+        for move in moves:
+            to_sq = (move >> TO_SHIFT) & 63
+
+            if move == tt_move:
+                score = self.TT_MOVE_SCORE
+            elif (goal >> to_sq) & 1:
+                score = self.WIN_SCORE
+            elif move & CAPTURE_FLAG:
+                to_row = to_sq >> 3
+                victim_advancement = to_row if victim_moves_down else 7 - to_row
+                score = self.CAPTURE_SCORE + victim_advancement
+            elif move in killers:
+                score = self.KILLER_SCORE - killers.index(move)
+            else:
+                score = history[move & FROM_TO_MASK]
+            scores.append(score)
+
+        # Stable sort: ties keep generation order
+        order = sorted(range(len(moves)), key=scores.__getitem__, reverse=True)
+        return [moves[i] for i in order]
+
+    def is_quiet(self, move: Move) -> bool:
+        return not move & CAPTURE_FLAG
+
+    def record_cutoff(self, move: Move, depth: int, ply: int) -> None:
+        """Remember a quiet move that caused a beta cutoff."""
+        if ply < self.MAX_PLY:
+            slots = self.killers[ply]
+            if slots[0] != move:
+                slots[1] = slots[0]
+                slots[0] = move
+
+        self.history[move & FROM_TO_MASK] += depth * depth
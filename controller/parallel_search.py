@@ -0,0 +1,352 @@
+import multiprocessing
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Callable, List, Optional, Tuple
+
+from controller.ai_algorithm import MinimaxAlgorithm
+from controller.deepening import IterativeDeepening, SearchTimeout
+from controller.move_ordering import MoveOrderer
+from controller.progress import SearchProgress
+from controller.search_stats import COUNTERS, SearchStats
+from controller.transposition import TranspositionTable
+from model import (
+    BitboardState,
+    GameState,
+    Move,
+    MoveValidator,
+    PositionEvaluator,
+    PositionSerializer,
+)
+
+# Each worker process keeps one engine, so its transposition table and
+# history stay warm from one move to the next, and the game they are from
+_worker_algorithm = None
+_worker_game = 0
+
+
+def _init_worker(tt_size_mb: float, stop_event) -> None:
+    global _worker_algorithm
+    _worker_algorithm = MinimaxAlgorithm(tt_size_mb=tt_size_mb)
+    _worker_algorithm.stop_event = stop_event
+
+
+def _search_root_move(
+    position_data: bytes,
+    move: Move,
+    depth: int,
+    player: int,
+    alpha: float,
+    beta: float,
+    scout: bool,
+    deadline: Optional[float],
+    node_limit: Optional[int],
+    stoppable: bool,
+    game: int,
+) -> Tuple[Move, Optional[float], List[Move], dict]:
+    global _worker_game
+    position = PositionSerializer.bitboard_from_bytes(position_data)
+    algorithm = _worker_algorithm
+
+    # The first task of a new game clears what the last one left
+    if game != _worker_game:
+        algorithm.new_game()
+        _worker_game = game
+
+    # The deadline is wall-clock time; the search checks perf_counter
+    local_deadline = None
+    if deadline is not None:
+        local_deadline = time.perf_counter() + (deadline - time.time())
+
+    try:
+        score = algorithm.search_root_move(
+            position,
+            move,
+            depth,
+            player,
+            alpha,
+            beta,
+            local_deadline,
+            scout,
+            node_limit,
+            stoppable,
+        )
+    except SearchTimeout:
+        score = None
+
+    stats = algorithm.get_counters()
+    stats["tt_fill"] = algorithm.transposition_table.fill_level()
+    return move, score, algorithm.principal_variation, stats
+
+
+class ParallelSearch(IterativeDeepening):
+    """Root-split alpha-beta over a persistent pool of worker processes.
+
+    Each iteration searches the first root move on its own to set alpha,
+    then the remaining moves concurrently with null windows against that
+    bound, re-searching only those that fail high. A reply that fails low
+    only proves the move is no better than the current best.
+
+    iterative_deepening is MinimaxAlgorithm's, except that an
+    evaluation_callback can't be given: evaluations happen in the workers.
+    stop() and stop_requested behave as on MinimaxAlgorithm; the flag is
+    an Event shared with the workers, so they abandon their moves too.
+    """
+
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        tt_size_mb: float = TranspositionTable.DEFAULT_SIZE_MB,
+    ):
+        self.workers = workers or os.cpu_count() or 1
+
+        # Spawn rather than fork: the parent may be running a Qt event loop
+        context = multiprocessing.get_context("spawn")
+        self.stop_event = context.Event()
+        self.executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=context,
+            initializer=_init_worker,
+            initargs=(tt_size_mb, self.stop_event),
+        )
+
+        # The workers' counters, summed; phase timing isn't collected
+        # across processes, so these stats are never timed
+        self.counters = dict.fromkeys(COUNTERS, 0)
+        self.search_stats = SearchStats()
+        self.completed_depth = 0
+        self.principal_variation = []
+        self.tt_fill = 0.0
+        # Sent with every task; workers clear their tables when it changes
+        self.game = 0
+
+        self.progress = None
+        self.root_position = None
+        self.root_moves = []
+
+    def _start_deepening(
+        self,
+        state: GameState,
+        player: int,
+        evaluation_callback: Optional[Callable],
+        progress: Optional[SearchProgress],
+    ) -> None:
+        if evaluation_callback is not None:
+            raise ValueError("evaluation callbacks can't run in worker processes")
+        self.counters = dict.fromkeys(COUNTERS, 0)
+        self.search_stats = SearchStats()
+        self.completed_depth = 0
+        self.principal_variation = []
+        self.progress = progress
+
+        position = BitboardState.from_game_state(state)
+        moves = MoveValidator.get_all_valid_moves_bitboard(
+            position, position.current_player
+        )
+        # Immediate wins, then captures, then the rest; a later move only
+        # replaces the best on a strictly higher score, so ties go to the
+        # earlier one. Each iteration reorders by the previous one's scores
+        self.root_position = position
+        self.root_moves = MoveOrderer().order_moves(position, moves, 0)
+
+    def _search_depth(
+        self,
+        depth: int,
+        player: int,
+        expected_score: Optional[float],
+        deadline: Optional[float],
+        node_limit: Optional[int],
+        stoppable: bool,
+    ) -> Tuple[float, Optional[Move]]:
+        position = self.root_position
+        moves = self.root_moves
+        if position.winner is not None:
+            return PositionEvaluator.evaluate_bitboard(position, player), None
+        if not moves:
+            return -PositionEvaluator.WIN_VALUE, None
+
+        # Workers run on their own clocks, so they get wall-clock time
+        if deadline is not None:
+            deadline = time.time() + (deadline - time.perf_counter())
+
+        result = self._search_iteration(
+            position,
+            moves,
+            depth,
+            player,
+            expected_score,
+            deadline,
+            node_limit,
+            stoppable,
+        )
+        if result is None:
+            raise SearchTimeout()
+        best_score, best_move, scores, self.principal_variation = result
+
+        # Next iteration: best move first, then by this iteration's scores
+        moves.sort(key=lambda move: scores[move], reverse=True)
+        moves.remove(best_move)
+        moves.insert(0, best_move)
+        return best_score, best_move
+
+    def _search_iteration(
+        self,
+        position: BitboardState,
+        moves: List[Move],
+        depth: int,
+        player: int,
+        expected_score: Optional[float],
+        deadline: Optional[float],
+        node_limit: Optional[int],
+        stoppable: bool,
+    ) -> Optional[Tuple[float, Move, dict, List[Move]]]:
+        progress = self.progress
+        # Sent to every task, so in the fixed-size binary form
+        position_data = PositionSerializer.bitboard_to_bytes(position)
+        scores = {}
+
+        # Aspiration window for the first move, as in the serial search
+        alpha, beta = float("-inf"), float("inf")
+        window = MinimaxAlgorithm.ASPIRATION_WINDOW
+        if (
+            expected_score is not None
+            and abs(expected_score) < MinimaxAlgorithm.PROVEN_SCORE
+        ):
+            alpha, beta = expected_score - window, expected_score + window
+
+        while True:
+            first = self.executor.submit(
+                _search_root_move,
+                position_data,
+                moves[0],
+                depth,
+                player,
+                alpha,
+                beta,
+                False,
+                deadline,
+                self._nodes_left(node_limit),
+                stoppable,
+                self.game,
+            )
+            move, best_score, best_line, stats = first.result()
+            self._add_stats(stats)
+            if best_score is None or self._over_limit(node_limit):
+                return None
+            if alpha < best_score < beta:
+                break
+            self.counters["aspiration_researches"] += 1
+            alpha, beta = float("-inf"), float("inf")
+
+        best_move = move
+        scores[move] = best_score
+        if progress is not None:
+            self._report(progress, move)
+
+        pending = {
+            self.executor.submit(
+                _search_root_move,
+                position_data,
+                move,
+                depth,
+                player,
+                best_score,
+                float("inf"),
+                True,
+                deadline,
+                self._nodes_left(node_limit),
+                stoppable,
+                self.game,
+            )
+            for move in moves[1:]
+        }
+
+        timed_out = False
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                move, score, line, stats = future.result()
+                self._add_stats(stats)
+
+                if score is None or self._over_limit(node_limit):
+                    timed_out = True
+                    continue
+
+                scores[move] = score
+                if score > best_score:
+                    best_score, best_move, best_line = score, move, line
+
+                if progress is not None:
+                    self._report(progress, move)
+
+            if timed_out:
+                for future in pending:
+                    future.cancel()
+                wait(pending)
+                return None
+
+        return best_score, best_move, scores, best_line
+
+    def _nodes_left(self, node_limit: Optional[int]) -> Optional[int]:
+        # Each task may spend what is left when it is sent; moves that
+        # together pass the limit abandon the iteration in _over_limit
+        if node_limit is None:
+            return None
+        return max(0, node_limit - self._nodes_searched())
+
+    def _over_limit(self, node_limit: Optional[int]) -> bool:
+        return node_limit is not None and self._nodes_searched() > node_limit
+
+    def _report(self, progress: SearchProgress, move: Move) -> None:
+        progress.root_move = move
+        progress.nodes = self.counters["nodes"] + self.counters["quiescence_nodes"]
+
+    def _add_stats(self, stats: dict) -> None:
+        counters = self.counters
+        for key in COUNTERS:
+            counters[key] += stats[key]
+        self.tt_fill = stats["tt_fill"]
+
+    def stop(self) -> None:
+        self.stop_event.set()
+
+    @property
+    def stop_requested(self) -> bool:
+        return self.stop_event.is_set()
+
+    @stop_requested.setter
+    def stop_requested(self, value: bool) -> None:
+        if value:
+            self.stop_event.set()
+        else:
+            self.stop_event.clear()
+
+    def get_nodes_visited(self) -> int:
+        return self.counters["nodes"]
+
+    def get_quiescence_nodes(self) -> int:
+        return self.counters["quiescence_nodes"]
+
+    def get_counters(self) -> dict:
+        return dict(self.counters)
+
+    def get_search_stats(self) -> dict:
+        return self.search_stats.to_dict()
+
+    def get_tt_stats(self) -> dict:
+        return {
+            "tt_hit_rate": (
+                self.counters["tt_hits"] / self.counters["tt_probes"]
+                if self.counters["tt_probes"]
+                else 0.0
+            ),
+            "tt_fill": self.tt_fill,
+        }
+
+    def new_game(self) -> None:
+        """Have every worker forget earlier games before its next task."""
+        self.game += 1
+
+    def shutdown(self, wait: bool = False) -> None:
+        # Callers about to exit wait, so no worker starts after they are gone
+        self.executor.shutdown(wait=wait)
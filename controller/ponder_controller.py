@@ -0,0 +1,72 @@
+import time
+
+from PyQt6.QtCore import QThread
+
+from controller.ai_algorithm import MinimaxAlgorithm
+from model import GameRules, GameState, decode_move, decode_moves
+
+
+class PonderController(QThread):
+    """Searches on the human's time with the AI's long-lived engine.
+
+    With an expected reply, the position after it is searched for the AI,
+    so a correct guess leaves a finished or nearly finished search. Without
+    one, the current position is searched for the human, which spreads the
+    time over all replies and leaves their subtrees in the shared tables.
+    """
+
+    def __init__(
+        self,
+        state: GameState,
+        algorithm: MinimaxAlgorithm,
+        expected_reply: tuple = None,
+    ):
+        super().__init__()
+
+        self.state = state.copy()
+        self.algorithm = algorithm
+        self.expected_reply = expected_reply
+        if expected_reply is not None:
+            GameRules.execute_move(self.state, expected_reply[0], expected_reply[1])
+
+        self.best_score = None
+        self.best_move = None
+        self.completed_depth = 0
+        self.principal_variation = []
+        self.nodes_visited = 0
+        self.start_time = 0
+        self.elapsed = 0.0
+
+        self.algorithm.stop_requested = False
+
+    def run(self):
+        self.start_time = time.time()
+        self.algorithm.iterative_deepening(
+            self.state,
+            self.state.current_player,
+            MinimaxAlgorithm.MAX_TIMED_DEPTH,
+            iteration_callback=self._on_iteration,
+        )
+
+    def _on_iteration(self, depth: int, score: float, move: int):
+        # Decoded here: the game controller works in (row, col) pairs
+        self.best_score = score
+        self.best_move = decode_move(move) if move is not None else None
+        self.completed_depth = depth
+        self.principal_variation = decode_moves(self.algorithm.principal_variation)
+        self.nodes_visited = self.algorithm.get_nodes_visited()
+
+    def stop(self):
+        self.algorithm.stop()
+        self.wait()
+        self.algorithm.stop_requested = False
+        if self.start_time:
+            self.elapsed = time.time() - self.start_time
+
+    def is_hit(self, state: GameState) -> bool:
+        """Whether the human played the reply this search was pondering."""
+        return (
+            self.expected_reply is not None
+            and state.current_player == self.state.current_player
+            and state.board == self.state.board
+        )
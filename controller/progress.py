@@ -0,0 +1,49 @@
+import threading
+from typing import List
+
+from model import Move
+
+
+class SearchProgress:
+    """Latest state of a running search, for a reader on another thread.
+
+    The search only writes plain attributes: the root move as it starts
+    each one, and the node count at its clock checks. Iteration results
+    change several fields at once, so those go through the lock that
+    snapshot() takes. Moves are left encoded; see model.moves.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.depth = 0
+            self.root_move = None
+            self.nodes = 0
+            self.completed_depth = 0
+            self.score = None
+            self.principal_variation = []
+
+    def start_iteration(self, depth: int) -> None:
+        self.depth = depth
+
+    def finish_iteration(
+        self, depth: int, score: float, principal_variation: List[Move]
+    ) -> None:
+        with self._lock:
+            self.completed_depth = depth
+            self.score = score
+            self.principal_variation = list(principal_variation)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "depth": self.depth,
+                "root_move": self.root_move,
+                "nodes_visited": self.nodes,
+                "completed_depth": self.completed_depth,
+                "evaluation": self.score,
+                "principal_variation": self.principal_variation,
+            }
@@ -0,0 +1,126 @@
+import time
+from typing import Callable, Dict, Optional
+
+# Phases timed when timing is on. The engine updates one position in
+# place rather than copying it, so make/unmake stands in for state copying
+PHASES = ("move_generation", "evaluation", "make_unmake")
+
+# Cumulative counters every engine keeps; iterations record the difference
+COUNTERS = (
+    "nodes",
+    "interior_nodes",
+    "leaf_nodes",
+    "quiescence_nodes",
+    "cutoffs",
+    "first_move_cutoffs",
+    "aspiration_researches",
+    "reductions",
+    "reduction_researches",
+    "futility_prunes",
+    "tt_probes",
+    "tt_hits",
+)
+
+
+class SearchStats:
+    """Per-depth breakdown of one iterative-deepening search.
+
+    An engine's counters are cheap enough to keep all the time; this only
+    records how much each iteration added to them. Phase timing wraps the
+    functions the search calls, which slows it down, so it is opt-in.
+    """
+
+    def __init__(self, timed: bool = False):
+        self.timed = timed
+        self.depths = []
+        self.phase_times = dict.fromkeys(PHASES, 0.0)
+        self.phase_calls = dict.fromkeys(PHASES, 0)
+
+        self._start_counters = None
+        self._start_phase_times = None
+        self._start_time = 0.0
+
+    def timer(self, phase: str, func: Callable) -> Callable:
+        times = self.phase_times
+        calls = self.phase_calls
+        clock = time.perf_counter
+
+        def timed(*args):
+            start = clock()
+            result = func(*args)
+            times[phase] += clock() - start
+            calls[phase] += 1
+            return result
+
+        return timed
+
+    def start_iteration(self, counters: Dict[str, int]) -> None:
+        self._start_counters = counters
+        self._start_phase_times = dict(self.phase_times)
+        self._start_time = time.perf_counter()
+
+    def finish_iteration(
+        self, depth: int, counters: Dict[str, int], completed: bool = True
+    ) -> None:
+        record = {
+            "depth": depth,
+            "completed": completed,
+            "time": time.perf_counter() - self._start_time,
+        }
+        for key in COUNTERS:
+            record[key] = counters[key] - self._start_counters[key]
+
+        cutoffs = record["cutoffs"]
+        record["first_move_cutoff_rate"] = (
+            record["first_move_cutoffs"] / cutoffs if cutoffs else 0.0
+        )
+        record["tt_hit_rate"] = (
+            record["tt_hits"] / record["tt_probes"] if record["tt_probes"] else 0.0
+        )
+
+        # Nodes this depth took per node the one before took
+        previous = self._last_completed()
+        if completed and previous is not None and previous["nodes"]:
+            record["branching_factor"] = record["nodes"] / previous["nodes"]
+        else:
+            record["branching_factor"] = None
+
+        if self.timed:
+            record["phase_times"] = {
+                phase: self.phase_times[phase] - self._start_phase_times[phase]
+                for phase in PHASES
+            }
+
+        self.depths.append(record)
+
+    def _last_completed(self) -> Optional[dict]:
+        for record in reversed(self.depths):
+            if record["completed"]:
+                return record
+        return None
+
+    def effective_branching_factor(self) -> Optional[float]:
+        """Geometric mean growth in nodes per extra ply of depth.
+
+        Taken over all completed iterations, which evens out the swing
+        between odd and even depths.
+        """
+        completed = [r for r in self.depths if r["completed"] and r["nodes"]]
+        if len(completed) < 2:
+            return None
+        first, last = completed[0], completed[-1]
+        return (last["nodes"] / first["nodes"]) ** (
+            1.0 / (last["depth"] - first["depth"])
+        )
+
+    def to_dict(self) -> dict:
+        """Everything recorded, as plain JSON-serialisable data."""
+        stats = {
+            "timed": self.timed,
+            "effective_branching_factor": self.effective_branching_factor(),
+            "depths": [dict(record) for record in self.depths],
+        }
+        if self.timed:
+            stats["phase_times"] = dict(self.phase_times)
+            stats["phase_calls"] = dict(self.phase_calls)
+        return stats
@@ -0,0 +1,92 @@
+import sys
+from typing import Optional, Tuple
+
+EXACT = 0
+LOWER_BOUND = 1  # Search failed high: true score >= stored score
+UPPER_BOUND = 2  # Search failed low: true score <= stored score
+
+
+class TranspositionTable:
+    """Fixed-size two-tier table keyed by Zobrist hash.
+
+    Each bucket has a depth-preferred slot and an always-replace slot.
+    Entries are (key, depth, score, bound, best_move) tuples, with the
+    move encoded as in model.moves.
+    """
+
+    # CPython footprint of one stored entry, at its largest: the tuple, a
+    # 64-bit key, a score (an int or a float), a move past the small-int
+    # cache, and the entry's list slot
+    ENTRY_BYTES = (
+        sys.getsizeof((0, 0, 0, 0, 0))
+        + sys.getsizeof(1 << 63)
+        + max(sys.getsizeof(0.0), sys.getsizeof(1 << 12))
+        + sys.getsizeof(1 << 12)
+        + 8
+    )
+    DEFAULT_SIZE_MB = 16
+
+    def __init__(self, size_mb: float = DEFAULT_SIZE_MB):
+        self.size_mb = size_mb
+        bucket_bytes = self.ENTRY_BYTES * 2
+        self.bucket_count = max(1, int(size_mb * 1024 * 1024) // bucket_bytes)
+        self.entries = [None] * (self.bucket_count * 2)
+
+        self.filled = 0
+        self.probes = 0
+        self.hits = 0
+
+    def clear(self) -> None:
+        self.entries = [None] * (self.bucket_count * 2)
+        self.filled = 0
+        self.reset_stats()
+
+    def reset_stats(self) -> None:
+        self.probes = 0
+        self.hits = 0
+
+    def probe(self, key: int) -> Optional[Tuple]:
+        self.probes += 1
+        index = (key % self.bucket_count) * 2
+        entries = self.entries
+
+        entry = entries[index]
+        if entry is not None and entry[0] == key:
+            self.hits += 1
+            return entry
+
+        entry = entries[index + 1]
+        if entry is not None and entry[0] == key:
+            self.hits += 1
+            return entry
+
+        return None
+
+    def store(
+        self, key: int, depth: int, score: float, bound: int, best_move: Optional[int]
+    ) -> None:
+        index = (key % self.bucket_count) * 2
+        entries = self.entries
+        new_entry = (key, depth, score, bound, best_move)
+
+        deep = entries[index]
+        if deep is None:
+            self.filled += 1
+            entries[index] = new_entry
+        elif deep[0] == key or depth >= deep[1]:
+            if deep[0] != key:
+                # Demote the old deep entry instead of losing it outright
+                if entries[index + 1] is None:
+                    self.filled += 1
+                entries[index + 1] = deep
+            entries[index] = new_entry
+        else:
+            if entries[index + 1] is None:
+                self.filled += 1
+            entries[index + 1] = new_entry
+
+    def hit_rate(self) -> float:
+        return self.hits / self.probes if self.probes else 0.0
+
+    def fill_level(self) -> float:
+        return self.filled / len(self.entries)
@@ -12,6 +12,7 @@ def main():
 
     controller = GameController()
     controller.show()
+    app.aboutToQuit.connect(controller.shutdown)
 
     sys.exit(app.exec())
 
@@ -1,6 +1,22 @@
+from model.bitboard import BitboardState
 from model.evaluator import PositionEvaluator
 from model.game_rules import GameRules
 from model.game_state import GameState
 from model.move_validator import MoveValidator
+from model.moves import Move, decode_move, decode_moves, encode_move
+from model.serialization import PositionSerializer
+from model.threats import ThreatDetector
 
-__all__ = ["GameState", "MoveValidator", "GameRules", "PositionEvaluator"]
+__all__ = [
+    "GameState",
+    "BitboardState",
+    "MoveValidator",
+    "GameRules",
+    "PositionEvaluator",
+    "ThreatDetector",
+    "PositionSerializer",
+    "Move",
+    "encode_move",
+    "decode_move",
+    "decode_moves",
+]
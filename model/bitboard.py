@@ -0,0 +1,218 @@
+from typing import List, Optional, Tuple
+
+from model.game_state import GameState
+from model.moves import CAPTURE_FLAG, SQUARE_MASK, TO_SHIFT, Move
+from model.zobrist import PIECE_KEYS, SIDE_KEY, compute_hash
+
+BOARD_SIZE = 8
+FULL_MASK = (1 << 64) - 1
+
+# Square index is row * 8 + col, so bit 0 is the top-left square.
+FILE_A = 0x0101010101010101
+FILE_H = FILE_A << 7
+NOT_FILE_A = FULL_MASK ^ FILE_A
+NOT_FILE_H = FULL_MASK ^ FILE_H
+ROW_MASKS = [0xFF << (8 * row) for row in range(BOARD_SIZE)]
+
+# Indexed by player: the row each side wins on, and that row plus the one
+# in front of it. White moves down the board, Black up.
+GOAL_ROWS = (0, ROW_MASKS[BOARD_SIZE - 1], ROW_MASKS[0])
+GOAL_ZONES = (
+    0,
+    ROW_MASKS[BOARD_SIZE - 2] | ROW_MASKS[BOARD_SIZE - 1],
+    ROW_MASKS[0] | ROW_MASKS[1],
+)
+
+
+if hasattr(int, "bit_count"):
+
+    def popcount(bb: int) -> int:
+        return bb.bit_count()
+
+else:  # Python < 3.10
+
+    def popcount(bb: int) -> int:
+        return bin(bb).count("1")
+
+
+def advancement_sum(pieces: int, moves_down: bool) -> int:
+    total = 0
+    for distance in range(1, BOARD_SIZE):
+        row = distance if moves_down else (BOARD_SIZE - 1) - distance
+        total += distance * popcount(pieces & ROW_MASKS[row])
+    return total
+
+
+class BitboardState:
+    """Engine-side position: one 64-bit mask per side plus the side to move.
+
+    ``hash`` is a Zobrist key and ``white_advancement``/``black_advancement``
+    are each side's summed rows travelled; make_move/unmake_move keep all
+    three up to date.
+    """
+
+    __slots__ = (
+        "white",
+        "black",
+        "current_player",
+        "winner",
+        "hash",
+        "white_advancement",
+        "black_advancement",
+    )
+
+    def __init__(
+        self,
+        white: int = 0,
+        black: int = 0,
+        current_player: int = GameState.WHITE,
+        winner: Optional[int] = None,
+    ):
+        self.white = white
+        self.black = black
+        self.current_player = current_player
+        self.winner = winner
+        self.hash = compute_hash(white, black, current_player)
+        # White moves down the board, Black up
+        self.white_advancement = advancement_sum(white, True)
+        self.black_advancement = advancement_sum(black, False)
+
+    @classmethod
+    def from_game_state(cls, state: GameState) -> "BitboardState":
+        white = 0
+        black = 0
+        bit = 1
+        for row in state.board:
+            for piece in row:
+                if piece == GameState.WHITE:
+                    white |= bit
+                elif piece == GameState.BLACK:
+                    black |= bit
+                bit <<= 1
+
+        return cls(white, black, state.current_player, state.winner)
+
+    def to_board(self) -> List[List[int]]:
+        board = []
+        bit = 1
+        for _ in range(BOARD_SIZE):
+            row = []
+            for _ in range(BOARD_SIZE):
+                if self.white & bit:
+                    row.append(GameState.WHITE)
+                elif self.black & bit:
+                    row.append(GameState.BLACK)
+                else:
+                    row.append(GameState.EMPTY)
+                bit <<= 1
+            board.append(row)
+        return board
+
+    def to_game_state(self) -> GameState:
+        state = GameState(self.to_board())
+        state.current_player = self.current_player
+        state.winner = self.winner
+        return state
+
+    def pieces(self, player: int) -> int:
+        return self.white if player == GameState.WHITE else self.black
+
+    def occupied(self) -> int:
+        return self.white | self.black
+
+    def empty(self) -> int:
+        return FULL_MASK ^ (self.white | self.black)
+
+    def moves_down(self, player: int) -> bool:
+        return player == GameState.WHITE
+
+    def advancement(self, player: int) -> int:
+        if player == GameState.WHITE:
+            return self.white_advancement
+        return self.black_advancement
+
+    def goal_row_mask(self, player: int) -> int:
+        return GOAL_ROWS[player]
+
+    def goal_zone_mask(self, player: int) -> int:
+        return GOAL_ZONES[player]
+
+    def switch_player(self) -> None:
+        self.current_player = (
+            GameState.BLACK
+            if self.current_player == GameState.WHITE
+            else GameState.WHITE
+        )
+
+    def make_move(self, move: Move) -> Tuple[Optional[int], int, int]:
+        """Apply a generated move in place.
+
+        The move's capture flag says whether the opponent loses a piece,
+        so the move has to come from a generator for this position.
+        Returns an undo record of (previous winner, previous player,
+        previous hash) for unmake_move.
+        """
+        player = self.current_player
+        from_sq = move & SQUARE_MASK
+        to_sq = (move >> TO_SHIFT) & SQUARE_MASK
+        from_bit = 1 << from_sq
+        to_bit = 1 << to_sq
+        undo_hash = self.hash
+        keys = PIECE_KEYS[player]
+        key = undo_hash ^ keys[from_sq] ^ keys[to_sq]
+
+        # Every move advances the mover one row; a victim loses the rows
+        # it had travelled, measured in its own direction.
+        if player == GameState.WHITE:
+            if move & CAPTURE_FLAG:
+                self.black ^= to_bit
+                key ^= PIECE_KEYS[GameState.BLACK][to_sq]
+                self.black_advancement -= self._victim_advancement(to_sq)
+            self.white ^= from_bit | to_bit
+            self.white_advancement += 1
+        else:
+            if move & CAPTURE_FLAG:
+                self.white ^= to_bit
+                key ^= PIECE_KEYS[GameState.WHITE][to_sq]
+                self.white_advancement -= self._victim_advancement(to_sq)
+            self.black ^= from_bit | to_bit
+            self.black_advancement += 1
+
+        undo = (self.winner, player, undo_hash)
+
+        if to_bit & self.goal_row_mask(player):
+            self.winner = player
+        else:
+            self.switch_player()
+            key ^= SIDE_KEY
+
+        self.hash = key
+
+        return undo
+
+    def unmake_move(self, move: Move, undo: tuple) -> None:
+        self.winner, player, self.hash = undo
+        self.current_player = player
+        to_sq = (move >> TO_SHIFT) & SQUARE_MASK
+        from_bit = 1 << (move & SQUARE_MASK)
+        to_bit = 1 << to_sq
+
+        if player == GameState.WHITE:
+            self.white ^= from_bit | to_bit
+            self.white_advancement -= 1
+            if move & CAPTURE_FLAG:
+                self.black |= to_bit
+                self.black_advancement += self._victim_advancement(to_sq)
+        else:
+            self.black ^= from_bit | to_bit
+            self.black_advancement -= 1
+            if move & CAPTURE_FLAG:
+                self.white |= to_bit
+                self.white_advancement += self._victim_advancement(to_sq)
+
+    def _victim_advancement(self, sq: int) -> int:
+        # The victim is the side not to move; Black pieces travel up
+        row = sq >> 3
+        if self.current_player == GameState.WHITE:
+            return (BOARD_SIZE - 1) - row
+        return row
@@ -1,5 +1,7 @@
+from model.bitboard import BitboardState, popcount
 from model.game_state import GameState
 from model.move_validator import MoveValidator
+from model.threats import ThreatDetector
 
 
 class PositionEvaluator:
@@ -9,30 +11,30 @@ class PositionEvaluator:
     WIN_VALUE = 10000
 
     @staticmethod
-    def evaluate(state: GameState, player: int, human_player: int = None) -> float:
+    def evaluate(state: GameState, player: int) -> float:
         if state.winner == player:
             return PositionEvaluator.WIN_VALUE
         elif state.winner is not None:
             return -PositionEvaluator.WIN_VALUE
 
+        decided = PositionEvaluator._evaluate_threats(
+            BitboardState.from_game_state(state), player
+        )
+        if decided:
+            return decided
+
         opponent = GameState.BLACK if player == GameState.WHITE else GameState.WHITE
         score = 0.0
 
-        score += PositionEvaluator._evaluate_material_and_position(
-            state, player, human_player
-        )
-        score -= PositionEvaluator._evaluate_material_and_position(
-            state, opponent, human_player
-        )
+        score += PositionEvaluator._evaluate_material_and_position(state, player)
+        score -= PositionEvaluator._evaluate_material_and_position(state, opponent)
 
         score += PositionEvaluator._evaluate_mobility(state, player, opponent)
 
         return score
 
     @staticmethod
-    def _evaluate_material_and_position(
-        state: GameState, player: int, human_player: int = None
-    ) -> float:
+    def _evaluate_material_and_position(state: GameState, player: int) -> float:
         score = 0.0
 
         for row in range(state.BOARD_SIZE):
@@ -43,26 +45,18 @@ class PositionEvaluator:
                     score += PositionEvaluator.MATERIAL_VALUE
 
                     advancement = PositionEvaluator._calculate_advancement(
-                        row, player, state.BOARD_SIZE, human_player
+                        row, player, state.BOARD_SIZE
                     )
                     score += advancement * PositionEvaluator.ADVANCEMENT_VALUE
 
         return score
 
     @staticmethod
-    def _calculate_advancement(
-        row: int, player: int, board_size: int, human_player: int = None
-    ) -> int:
-        if human_player == GameState.WHITE:
-            if player == GameState.WHITE:
-                return (board_size - 1) - row
-            else:
-                return row
-        else:
-            if player == GameState.WHITE:
-                return row
-            else:
-                return (board_size - 1) - row
+    def _calculate_advancement(row: int, player: int, board_size: int) -> int:
+        # White moves down the board, Black up
+        if player == GameState.WHITE:
+            return row
+        return (board_size - 1) - row
 
     @staticmethod
     def _evaluate_mobility(state: GameState, player: int, opponent: int) -> float:
@@ -72,9 +66,7 @@ class PositionEvaluator:
         return (player_moves - opponent_moves) * PositionEvaluator.MOBILITY_VALUE
 
     @staticmethod
-    def quick_evaluate(
-        state: GameState, player: int, human_player: int = None
-    ) -> float:
+    def quick_evaluate(state: GameState, player: int) -> float:
         if state.winner == player:
             return PositionEvaluator.WIN_VALUE
         elif state.winner is not None:
@@ -82,11 +74,65 @@ class PositionEvaluator:
 
         opponent = GameState.BLACK if player == GameState.WHITE else GameState.WHITE
 
-        score = PositionEvaluator._evaluate_material_and_position(
-            state, player, human_player
+        score = PositionEvaluator._evaluate_material_and_position(state, player)
+        score -= PositionEvaluator._evaluate_material_and_position(state, opponent)
+
+        return score
+
+    @staticmethod
+    def evaluate_bitboard(position: BitboardState, player: int) -> float:
+        if position.winner == player:
+            return PositionEvaluator.WIN_VALUE
+        elif position.winner is not None:
+            return -PositionEvaluator.WIN_VALUE
+
+        decided = PositionEvaluator._evaluate_threats(position, player)
+        if decided:
+            return decided
+
+        opponent = GameState.BLACK if player == GameState.WHITE else GameState.WHITE
+        score = 0.0
+
+        score += PositionEvaluator._evaluate_material_and_position_bitboard(
+            position, player
         )
-        score -= PositionEvaluator._evaluate_material_and_position(
-            state, opponent, human_player
+        score -= PositionEvaluator._evaluate_material_and_position_bitboard(
+            position, opponent
+        )
+
+        score += PositionEvaluator._evaluate_mobility_bitboard(
+            position, player, opponent
         )
 
         return score
+
+    @staticmethod
+    def _evaluate_threats(position: BitboardState, player: int) -> float:
+        # A race the board already decides scores like a finished game,
+        # less the plies it takes, so nearer results score further from 0
+        forced = ThreatDetector.forced_result(position)
+        if not forced:
+            return 0.0
+        score = PositionEvaluator.WIN_VALUE - ThreatDetector.plies_to_result(forced)
+        if (forced > 0) == (player == position.current_player):
+            return score
+        return -score
+
+    @staticmethod
+    def _evaluate_material_and_position_bitboard(
+        position: BitboardState, player: int
+    ) -> float:
+        # Advancement is maintained incrementally by make_move/unmake_move
+        return (
+            popcount(position.pieces(player)) * PositionEvaluator.MATERIAL_VALUE
+            + position.advancement(player) * PositionEvaluator.ADVANCEMENT_VALUE
+        )
+
+    @staticmethod
+    def _evaluate_mobility_bitboard(
+        position: BitboardState, player: int, opponent: int
+    ) -> float:
+        player_moves = MoveValidator.count_valid_moves_bitboard(position, player)
+        opponent_moves = MoveValidator.count_valid_moves_bitboard(position, opponent)
+
+        return (player_moves - opponent_moves) * PositionEvaluator.MOBILITY_VALUE
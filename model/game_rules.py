@@ -1,70 +1,51 @@
-from typing import Tuple
+from typing import Optional, Tuple
 
+from model.bitboard import BitboardState
 from model.game_state import GameState
 from model.move_validator import MoveValidator
+from model.threats import ThreatDetector
 
 
 class GameRules:
     @staticmethod
-    def setup_initial_position(state: GameState, human_player: int = None) -> None:
-        if human_player == GameState.WHITE:
-            for row in range(6, 8):
-                for col in range(state.BOARD_SIZE):
-                    state.set_piece(row, col, GameState.WHITE)
-
-            for row in range(2):
-                for col in range(state.BOARD_SIZE):
-                    state.set_piece(row, col, GameState.BLACK)
-        else:
-            for row in range(2):
-                for col in range(state.BOARD_SIZE):
-                    state.set_piece(row, col, GameState.WHITE)
+    def setup_initial_position(state: GameState) -> None:
+        for row in range(2):
+            for col in range(state.BOARD_SIZE):
+                state.set_piece(row, col, GameState.WHITE)
 
-            for row in range(6, 8):
-                for col in range(state.BOARD_SIZE):
-                    state.set_piece(row, col, GameState.BLACK)
+        for row in range(6, 8):
+            for col in range(state.BOARD_SIZE):
+                state.set_piece(row, col, GameState.BLACK)
 
         state.current_player = GameState.WHITE
 
     @staticmethod
-    def check_win_condition(
-        state: GameState, row: int, piece: int, human_player: int = None
-    ) -> bool:
-        if human_player == GameState.WHITE:
-            if piece == GameState.WHITE and row == 0:
-                return True
-            if piece == GameState.BLACK and row == state.BOARD_SIZE - 1:
-                return True
-        else:
-            if piece == GameState.WHITE and row == state.BOARD_SIZE - 1:
-                return True
-            if piece == GameState.BLACK and row == 0:
-                return True
-
-        return False
+    def check_win_condition(state: GameState, row: int, piece: int) -> bool:
+        if piece == GameState.WHITE:
+            return row == state.BOARD_SIZE - 1
+        return row == 0
 
     @staticmethod
-    def is_game_over(state: GameState) -> bool:
-        if state.winner is not None:
-            return True
+    def get_winner(state: GameState) -> Optional[int]:
+        """The winner, counting a side to move with no moves as lost.
 
+        Only reads the state, so it is safe on positions other code shares.
+        """
+        if state.winner is not None:
+            return state.winner
         if not MoveValidator.has_valid_moves(state, state.current_player):
-            opponent = (
-                GameState.BLACK
-                if state.current_player == GameState.WHITE
-                else GameState.WHITE
-            )
-            state.set_winner(opponent)
-            return True
+            return GameRules.get_opponent(state.current_player)
+        return None
 
-        return False
+    @staticmethod
+    def is_game_over(state: GameState) -> bool:
+        return GameRules.get_winner(state) is not None
 
     @staticmethod
     def execute_move(
         state: GameState,
         from_pos: Tuple[int, int],
         to_pos: Tuple[int, int],
-        human_player: int = None,
     ) -> bool:
         if not MoveValidator.is_valid_move(state, from_pos, to_pos):
             return False
@@ -78,13 +59,29 @@ class GameRules:
 
         state.add_to_history(from_pos, to_pos)
 
-        if GameRules.check_win_condition(state, to_row, piece, human_player):
+        if GameRules.check_win_condition(state, to_row, piece):
             state.set_winner(piece)
         else:
             state.switch_player()
 
         return True
 
+    @staticmethod
+    def get_winner_bitboard(position: BitboardState) -> Optional[int]:
+        # Answered from the occupancy masks, without generating moves
+        if position.winner is not None:
+            return position.winner
+        if not MoveValidator.has_valid_moves_bitboard(
+            position, position.current_player
+        ):
+            return GameRules.get_opponent(position.current_player)
+        return None
+
+    @staticmethod
+    def get_forced_result_bitboard(position: BitboardState) -> int:
+        """Moves to a proven win (> 0) or loss (< 0) for the side to move, else 0."""
+        return ThreatDetector.forced_result(position)
+
     @staticmethod
     def get_opponent(player: int) -> int:
         return GameState.BLACK if player == GameState.WHITE else GameState.WHITE
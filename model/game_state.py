@@ -1,8 +1,14 @@
-from copy import deepcopy
 from typing import List, Optional
 
 
 class GameState:
+    """A position in the one orientation the model uses.
+
+    White always starts on rows 0-1 and moves down the board (increasing
+    row); Black starts on rows 6-7 and moves up. Which side is shown at
+    the bottom of the screen is the view's business.
+    """
+
     EMPTY = 0
     WHITE = 1
     BLACK = 2
@@ -21,7 +27,6 @@ class GameState:
         self.current_player = self.WHITE
         self.winner = None
         self.move_history = []
-        self.human_player = None  # Track board orientation
 
     def get_piece(self, row: int, col: int) -> int:
         if self.is_valid_position(row, col):
@@ -53,11 +58,10 @@ class GameState:
         return self.move_history[-1] if self.move_history else None
 
     def copy(self) -> "GameState":
-        new_state = GameState(deepcopy(self.board))
+        new_state = GameState([row[:] for row in self.board])
         new_state.current_player = self.current_player
         new_state.winner = self.winner
         new_state.move_history = self.move_history.copy()
-        new_state.human_player = self.human_player
         return new_state
 
     def count_pieces(self, player: int) -> int:
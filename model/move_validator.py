@@ -1,6 +1,95 @@
 from typing import List, Tuple
 
+from model.bitboard import (
+    BOARD_SIZE,
+    FULL_MASK,
+    NOT_FILE_A,
+    NOT_FILE_H,
+    BitboardState,
+    popcount,
+)
 from model.game_state import GameState
+from model.moves import Move, encode_move
+
+# Shared (row, col) tuples so generated moves don't allocate coordinates
+SQUARE_POSITIONS = tuple(divmod(sq, BOARD_SIZE) for sq in range(64))
+
+
+def _build_move_tables():
+    # Each table is indexed [player][square]; player 0 is unused
+    forward_targets = [None, None, None]
+    diagonal_targets = [None, None, None]
+    attack_masks = [None, None, None]
+    forward_moves = [None, None, None]
+    diagonal_moves = [None, None, None]
+
+    for player in (GameState.WHITE, GameState.BLACK):
+        # White moves down the board, Black up
+        direction = 1 if player == GameState.WHITE else -1
+
+        forward = []
+        diagonals = []
+        attacks = []
+        forward_encoded = []
+        diagonal_encoded = []
+        for sq in range(64):
+            row, col = divmod(sq, BOARD_SIZE)
+            new_row = row + direction
+
+            if not 0 <= new_row < BOARD_SIZE:
+                forward.append(-1)
+                diagonals.append(())
+                attacks.append(0)
+                forward_encoded.append(-1)
+                diagonal_encoded.append(())
+                continue
+
+            forward.append(new_row * BOARD_SIZE + col)
+            forward_encoded.append(encode_move(sq, new_row * BOARD_SIZE + col))
+            targets = tuple(
+                new_row * BOARD_SIZE + new_col
+                for new_col in (col - 1, col + 1)
+                if 0 <= new_col < BOARD_SIZE
+            )
+            diagonals.append(targets)
+            # Indexed by whether the target holds an enemy piece
+            diagonal_encoded.append(
+                tuple(
+                    (target, (encode_move(sq, target), encode_move(sq, target, True)))
+                    for target in targets
+                )
+            )
+            mask = 0
+            for target in targets:
+                mask |= 1 << target
+            attacks.append(mask)
+
+        forward_targets[player] = tuple(forward)
+        diagonal_targets[player] = tuple(diagonals)
+        attack_masks[player] = tuple(attacks)
+        forward_moves[player] = tuple(forward_encoded)
+        diagonal_moves[player] = tuple(diagonal_encoded)
+
+    return (
+        forward_targets,
+        diagonal_targets,
+        attack_masks,
+        forward_moves,
+        diagonal_moves,
+    )
+
+
+# Forward target square (-1 off the board), diagonal target squares, and
+# the bitmask of squares a piece attacks, built once at import. The
+# generators hand out the encoded moves below instead of building new ones:
+# the forward move, and per diagonal (target, (quiet move, capture)).
+(
+    FORWARD_TARGETS,
+    DIAGONAL_TARGETS,
+    ATTACK_MASKS,
+    FORWARD_MOVES,
+    DIAGONAL_MOVES,
+) = _build_move_tables()
 
 
 class MoveValidator:
@@ -11,46 +100,46 @@ class MoveValidator:
         if piece != state.current_player:
             return []
 
+        sq = row * BOARD_SIZE + col
+        board = state.board
         moves = []
 
-        # Determine direction based on board orientation
-        if hasattr(state, 'human_player') and state.human_player == GameState.WHITE:
-            # White at bottom (rows 6-7), moves up (decreasing row)
-            direction = -1 if piece == GameState.WHITE else 1
-        else:
-            # White at top (rows 0-1), moves down (increasing row)
-            direction = 1 if piece == GameState.WHITE else -1
-        new_row = row + direction
-
-        if state.is_valid_position(new_row, col):
-            if state.get_piece(new_row, col) == GameState.EMPTY:
-                moves.append((new_row, col))
-
-        for col_offset in [-1, 1]:
-            new_col = col + col_offset
+        forward = FORWARD_TARGETS[piece][sq]
+        if forward >= 0 and board[forward >> 3][forward & 7] == GameState.EMPTY:
+            moves.append(SQUARE_POSITIONS[forward])
 
-            if state.is_valid_position(new_row, new_col):
-                target = state.get_piece(new_row, new_col)
-
-                if target == GameState.EMPTY:
-                    moves.append((new_row, new_col))
-                elif target != piece and target != GameState.EMPTY:
-                    moves.append((new_row, new_col))
+        # Diagonal steps may land on an empty square or capture
+        for target in DIAGONAL_TARGETS[piece][sq]:
+            if board[target >> 3][target & 7] != piece:
+                moves.append(SQUARE_POSITIONS[target])
 
         return moves
 
     @staticmethod
-    def get_all_valid_moves(
-        state: GameState, player: int
-    ) -> List[Tuple[Tuple[int, int], Tuple[int, int]]]:
+    def get_all_valid_moves(state: GameState, player: int) -> List[Move]:
+        """Every move for player, as encoded moves (see model.moves)."""
+        # Only the side to move has moves, as in get_valid_moves
+        if player != state.current_player:
+            return []
+
+        forward_targets = FORWARD_TARGETS[player]
+        forward_moves = FORWARD_MOVES[player]
+        diagonal_moves = DIAGONAL_MOVES[player]
+        board = state.board
         all_moves = []
 
-        for row in range(state.BOARD_SIZE):
-            for col in range(state.BOARD_SIZE):
-                if state.get_piece(row, col) == player:
-                    valid_destinations = MoveValidator.get_valid_moves(state, row, col)
-                    for dest in valid_destinations:
-                        all_moves.append(((row, col), dest))
+        for sq in range(64):
+            if board[sq >> 3][sq & 7] != player:
+                continue
+
+            forward = forward_targets[sq]
+            if forward >= 0 and board[forward >> 3][forward & 7] == GameState.EMPTY:
+                all_moves.append(forward_moves[sq])
+
+            for target, encoded in diagonal_moves[sq]:
+                piece = board[target >> 3][target & 7]
+                if piece != player:
+                    all_moves.append(encoded[piece != GameState.EMPTY])
 
         return all_moves
 
@@ -59,10 +148,156 @@ class MoveValidator:
         state: GameState, from_pos: Tuple[int, int], to_pos: Tuple[int, int]
     ) -> bool:
         from_row, from_col = from_pos
+        to_row, to_col = to_pos
+
+        piece = state.get_piece(from_row, from_col)
+        if piece != state.current_player or not state.is_valid_position(
+            to_row, to_col
+        ):
+            return False
 
-        valid_moves = MoveValidator.get_valid_moves(state, from_row, from_col)
-        return to_pos in valid_moves
+        sq = from_row * BOARD_SIZE + from_col
+        to_sq = to_row * BOARD_SIZE + to_col
+        target = state.board[to_row][to_col]
+
+        if FORWARD_TARGETS[piece][sq] == to_sq:
+            return target == GameState.EMPTY
+        if to_sq in DIAGONAL_TARGETS[piece][sq]:
+            return target != piece
+
+        return False
 
     @staticmethod
     def has_valid_moves(state: GameState, player: int) -> bool:
-        return len(MoveValidator.get_all_valid_moves(state, player)) > 0
+        if player != state.current_player:
+            return False
+
+        forward_targets = FORWARD_TARGETS[player]
+        diagonal_targets = DIAGONAL_TARGETS[player]
+        board = state.board
+
+        for sq in range(64):
+            if board[sq >> 3][sq & 7] != player:
+                continue
+
+            forward = forward_targets[sq]
+            if forward >= 0 and board[forward >> 3][forward & 7] == GameState.EMPTY:
+                return True
+
+            for target in diagonal_targets[sq]:
+                if board[target >> 3][target & 7] != player:
+                    return True
+
+        return False
+
+    @staticmethod
+    def get_move_targets_bitboard(
+        position: BitboardState, player: int
+    ) -> Tuple[int, int, int]:
+        own = position.pieces(player)
+        not_own = FULL_MASK ^ own
+        empty = position.empty()
+
+        # (forward, towards col - 1, towards col + 1) destination masks
+        if player == GameState.WHITE:
+            forward = (own << 8) & empty
+            left = ((own & NOT_FILE_A) << 7) & not_own
+            right = ((own & NOT_FILE_H) << 9) & not_own
+        else:
+            forward = (own >> 8) & empty
+            left = ((own & NOT_FILE_A) >> 9) & not_own
+            right = ((own & NOT_FILE_H) >> 7) & not_own
+
+        return forward, left, right
+
+    @staticmethod
+    def get_all_valid_moves_bitboard(
+        position: BitboardState, player: int
+    ) -> List[Move]:
+        # Same contract as get_all_valid_moves: only the side to move has moves
+        if player != position.current_player:
+            return []
+
+        forward_targets = FORWARD_TARGETS[player]
+        forward_moves = FORWARD_MOVES[player]
+        diagonal_moves = DIAGONAL_MOVES[player]
+        own = position.pieces(player)
+        occupied = position.occupied()
+        enemy = occupied ^ own
+
+        all_moves = []
+        pieces = own
+
+        # Lowest bit first keeps the row-major order of get_all_valid_moves
+        while pieces:
+            low = pieces & -pieces
+            pieces ^= low
+            sq = low.bit_length() - 1
+
+            forward = forward_targets[sq]
+            if forward >= 0 and not (occupied >> forward) & 1:
+                all_moves.append(forward_moves[sq])
+
+            for target, encoded in diagonal_moves[sq]:
+                if not (own >> target) & 1:
+                    all_moves.append(encoded[(enemy >> target) & 1])
+
+        return all_moves
+
+    @staticmethod
+    def get_tactical_moves_bitboard(position: BitboardState, player: int) -> List[Move]:
+        """Captures and moves onto the last two rows, for quiescence search."""
+        if player != position.current_player:
+            return []
+
+        forward_targets = FORWARD_TARGETS[player]
+        forward_moves = FORWARD_MOVES[player]
+        diagonal_moves = DIAGONAL_MOVES[player]
+        attack_masks = ATTACK_MASKS[player]
+        own = position.pieces(player)
+        occupied = position.occupied()
+        enemy = occupied ^ own
+        zone = position.goal_zone_mask(player)
+        tactical = enemy | zone
+
+        moves = []
+        pieces = own
+
+        while pieces:
+            low = pieces & -pieces
+            pieces ^= low
+            sq = low.bit_length() - 1
+
+            # The forward square is on the same row as the diagonal ones
+            if not attack_masks[sq] & tactical:
+                continue
+
+            forward = forward_targets[sq]
+            if (zone >> forward) & 1 and not (occupied >> forward) & 1:
+                moves.append(forward_moves[sq])
+
+            for target, encoded in diagonal_moves[sq]:
+                if (tactical >> target) & 1 and not (own >> target) & 1:
+                    moves.append(encoded[(enemy >> target) & 1])
+
+        return moves
+
+    @staticmethod
+    def count_valid_moves_bitboard(position: BitboardState, player: int) -> int:
+        if player != position.current_player:
+            return 0
+
+        forward, left, right = MoveValidator.get_move_targets_bitboard(
+            position, player
+        )
+        return popcount(forward) + popcount(left) + popcount(right)
+
+    @staticmethod
+    def has_valid_moves_bitboard(position: BitboardState, player: int) -> bool:
+        if player != position.current_player:
+            return False
+
+        forward, left, right = MoveValidator.get_move_targets_bitboard(
+            position, player
+        )
+        return (forward | left | right) != 0
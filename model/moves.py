@@ -0,0 +1,63 @@
+from typing import List, Tuple
+
+# A move is one int: the from square in bits 0-5, the to square in bits
+# 6-11 and a capture flag in bit 12. Squares are row * 8 + col, as in the
+# bitboards. The engine keeps moves in this form; they are decoded to
+# ((row, col), (row, col)) pairs only where they leave the engine.
+Move = int
+
+TO_SHIFT = 6
+SQUARE_MASK = 0x3F
+# From and to squares together, an index into a 64 x 64 table
+FROM_TO_MASK = 0xFFF
+CAPTURE_FLAG = 1 << 12
+
+Position = Tuple[int, int]
+
+
+def encode_move(from_sq: int, to_sq: int, capture: bool = False) -> Move:
+    move = from_sq | (to_sq << TO_SHIFT)
+    return move | CAPTURE_FLAG if capture else move
+
+
+def move_to(move: Move) -> int:
+    return (move >> TO_SHIFT) & SQUARE_MASK
+
+
+def decode_move(move: Move) -> Tuple[Position, Position]:
+    return divmod(move & SQUARE_MASK, 8), divmod((move >> TO_SHIFT) & SQUARE_MASK, 8)
+
+
+def decode_moves(moves: List[Move]) -> List[Tuple[Position, Position]]:
+    return [decode_move(move) for move in moves]
+
+
+# Text notation: files a-h by column and ranks 1-8 by row, so White
+# starts on ranks 1-2, e.g. "a2a3"
+FILES = "abcdefgh"
+
+
+def square_name(sq: int) -> str:
+    return f"{FILES[sq & 7]}{(sq >> 3) + 1}"
+
+
+def move_to_text(move: Move) -> str:
+    return square_name(move & SQUARE_MASK) + square_name(
+        (move >> TO_SHIFT) & SQUARE_MASK
+    )
+
+
+def parse_square(text: str) -> int:
+    if len(text) != 2 or text[0] not in FILES or text[1] not in "12345678":
+        raise ValueError(f"not a square: {text!r}")
+    return (int(text[1]) - 1) * 8 + FILES.index(text[0])
+
+
+def parse_move_text(text: str) -> Tuple[int, int]:
+    """(from square, to square) of a move like "a2a3" or "a2-a3".
+
+    Text carries no capture flag; look the squares up among the
+    generated moves to get the encoded move.
+    """
+    text = text.replace("-", "")
+    return parse_square(text[:2]), parse_square(text[2:])
@@ -0,0 +1,120 @@
+import struct
+
+from model.bitboard import BOARD_SIZE, BitboardState
+from model.game_state import GameState
+
+# Text: rows from row 0 (White's home) joined by "/", runs of empty squares
+# as digits, then the side to move and the winner or "-":
+#   WWWWWWWW/WWWWWWWW/8/8/8/8/BBBBBBBB/BBBBBBBB w -
+# "." is read as one empty square, so rows written out square by square
+# parse too
+PIECE_LETTERS = {GameState.WHITE: "W", GameState.BLACK: "B"}
+LETTER_PIECES = {"W": GameState.WHITE, "B": GameState.BLACK}
+SIDE_LETTERS = {GameState.WHITE: "w", GameState.BLACK: "b"}
+LETTER_SIDES = {"w": GameState.WHITE, "b": GameState.BLACK}
+EMPTY_RUNS = "12345678"
+
+# Binary: the white and black masks as little-endian 64-bit ints, then a
+# flags byte with the side to move in bits 0-1 and the winner (0 for
+# none) in bits 2-3
+BINARY_FORMAT = struct.Struct("<QQB")
+BINARY_SIZE = BINARY_FORMAT.size
+WINNER_SHIFT = 2
+PLAYER_BITS = 0x3
+
+
+class PositionSerializer:
+    """Lossless text and binary forms of a position.
+
+    Both carry the board, side to move and winner; move history stays
+    with the GameState. Malformed input raises ValueError.
+    """
+
+    @staticmethod
+    def to_text(state: GameState) -> str:
+        rows = []
+        for row in state.board:
+            text = ""
+            empty = 0
+            for piece in row:
+                if piece == GameState.EMPTY:
+                    empty += 1
+                    continue
+                if empty:
+                    text += EMPTY_RUNS[empty - 1]
+                    empty = 0
+                text += PIECE_LETTERS[piece]
+            if empty:
+                text += EMPTY_RUNS[empty - 1]
+            rows.append(text)
+
+        winner = SIDE_LETTERS[state.winner] if state.winner is not None else "-"
+        return f"{'/'.join(rows)} {SIDE_LETTERS[state.current_player]} {winner}"
+
+    @staticmethod
+    def from_text(text: str) -> GameState:
+        fields = text.split()
+        if len(fields) != 3:
+            raise ValueError("expected <rows> <side to move> <winner>")
+        rows, side, winner = fields
+
+        board = []
+        for row_text in rows.split("/"):
+            row = []
+            for symbol in row_text:
+                if symbol in LETTER_PIECES:
+                    row.append(LETTER_PIECES[symbol])
+                elif symbol == ".":
+                    row.append(GameState.EMPTY)
+                elif symbol in EMPTY_RUNS:
+                    row.extend([GameState.EMPTY] * int(symbol))
+                else:
+                    raise ValueError(f"unknown square {symbol!r}")
+            if len(row) != BOARD_SIZE:
+                raise ValueError(f"row {row_text!r} is not 8 squares")
+            board.append(row)
+        if len(board) != BOARD_SIZE:
+            raise ValueError("a board is 8 rows")
+
+        if side not in LETTER_SIDES:
+            raise ValueError(f"unknown side to move {side!r}")
+        if winner != "-" and winner not in LETTER_SIDES:
+            raise ValueError(f"unknown winner {winner!r}")
+
+        state = GameState(board)
+        state.current_player = LETTER_SIDES[side]
+        state.winner = LETTER_SIDES.get(winner)
+        return state
+
+    @staticmethod
+    def to_bytes(state: GameState) -> bytes:
+        return PositionSerializer.bitboard_to_bytes(
+            BitboardState.from_game_state(state)
+        )
+
+    @staticmethod
+    def from_bytes(data: bytes) -> GameState:
+        return PositionSerializer.bitboard_from_bytes(data).to_game_state()
+
+    @staticmethod
+    def bitboard_to_bytes(position: BitboardState) -> bytes:
+        flags = position.current_player
+        if position.winner is not None:
+            flags |= position.winner << WINNER_SHIFT
+        return BINARY_FORMAT.pack(position.white, position.black, flags)
+
+    @staticmethod
+    def bitboard_from_bytes(data: bytes) -> BitboardState:
+        if len(data) != BINARY_SIZE:
+            raise ValueError(f"a binary position is {BINARY_SIZE} bytes")
+        white, black, flags = BINARY_FORMAT.unpack(data)
+
+        player = flags & PLAYER_BITS
+        winner = (flags >> WINNER_SHIFT) & PLAYER_BITS
+        if white & black:
+            raise ValueError("a square holds both sides")
+        # Spare bits must be clear, and 3 is neither side
+        if player not in SIDE_LETTERS or winner == 3 or flags >> 4:
+            raise ValueError(f"bad flags {flags:#04x}")
+
+        return BitboardState(white, black, player, winner or None)
@@ -0,0 +1,177 @@
+from model.bitboard import (
+    BOARD_SIZE,
+    FULL_MASK,
+    NOT_FILE_A,
+    NOT_FILE_H,
+    ROW_MASKS,
+    BitboardState,
+)
+from model.game_state import GameState
+
+
+def _build_cone_masks():
+    # Indexed [player][square], like the move tables
+    cone_masks = [None, None, None]
+
+    for player in (GameState.WHITE, GameState.BLACK):
+        direction = 1 if player == GameState.WHITE else -1
+
+        cones = []
+        for sq in range(64):
+            row, col = divmod(sq, BOARD_SIZE)
+            mask = 0
+            for steps in range(1, BOARD_SIZE):
+                ahead = row + direction * steps
+                if not 0 <= ahead < BOARD_SIZE:
+                    break
+                first = max(0, col - steps)
+                last = min(BOARD_SIZE - 1, col + steps)
+                for target_col in range(first, last + 1):
+                    mask |= 1 << (ahead * BOARD_SIZE + target_col)
+            cones.append(mask)
+
+        cone_masks[player] = tuple(cones)
+
+    return cone_masks
+
+
+# Squares ahead of a piece that an enemy must occupy to ever block or
+# capture it: k rows ahead, at most k files either side
+CONE_MASKS = _build_cone_masks()
+
+# DISTANCE_ROWS[moves_down][d] is the row d rows short of the goal row,
+# and WITHIN_ROWS[moves_down][d] covers distances 1 to d
+DISTANCE_ROWS = (
+    tuple(ROW_MASKS[d] if d < BOARD_SIZE else 0 for d in range(BOARD_SIZE + 1)),
+    tuple(
+        ROW_MASKS[BOARD_SIZE - 1 - d] if d < BOARD_SIZE else 0
+        for d in range(BOARD_SIZE + 1)
+    ),
+)
+WITHIN_ROWS = tuple(
+    tuple(sum(rows[1 : d + 1]) for d in range(BOARD_SIZE + 1))
+    for rows in DISTANCE_ROWS
+)
+
+
+class ThreatDetector:
+    """Reads races off the board without searching them.
+
+    Results are in moves of the side that wins: positive when the side to
+    move wins, negative when it loses, 0 when the board doesn't decide it.
+    Every result is a proof, so callers may treat it like a finished game.
+    """
+
+    @staticmethod
+    def forced_result(position: BitboardState) -> int:
+        # Called at every node, so the shifts are written out inline
+        player = position.current_player
+        # White moves down the board, Black up
+        if player == GameState.WHITE:
+            opponent = GameState.BLACK
+            own, enemy = position.white, position.black
+            moves_down = True
+        else:
+            opponent = GameState.WHITE
+            own, enemy = position.black, position.white
+            moves_down = False
+        rows = DISTANCE_ROWS[moves_down]
+        enemy_rows = DISTANCE_ROWS[not moves_down]
+
+        # Win in 1: a piece one row from home always has a move onto it
+        if own & rows[1]:
+            return 1
+
+        # The enemy wins next move unless its one runner is captured now
+        runners = enemy & enemy_rows[1]
+        if runners:
+            if moves_down:
+                own_attacks = ((own & NOT_FILE_A) << 7) | ((own & NOT_FILE_H) << 9)
+            else:
+                own_attacks = ((own & NOT_FILE_A) >> 9) | ((own & NOT_FILE_H) >> 7)
+            if runners & (runners - 1) or not runners & own_attacks:
+                return -1
+            return 0
+
+        # Win in 2: step onto a square one row from home that no enemy
+        # piece attacks; with no enemy runner it cannot be stopped
+        second = own & rows[2]
+        if second:
+            empty = FULL_MASK ^ (own | enemy)
+            if moves_down:
+                steps = ((second << 8) & empty) | (
+                    (((second & NOT_FILE_A) << 7) | ((second & NOT_FILE_H) << 9))
+                    & ~own
+                )
+                enemy_attacks = ((enemy & NOT_FILE_A) >> 9) | (
+                    (enemy & NOT_FILE_H) >> 7
+                )
+            else:
+                steps = ((second >> 8) & empty) | (
+                    (((second & NOT_FILE_A) >> 9) | ((second & NOT_FILE_H) >> 7))
+                    & ~own
+                )
+                enemy_attacks = ((enemy & NOT_FILE_A) << 7) | (
+                    (enemy & NOT_FILE_H) << 9
+                )
+            if steps & rows[1] & ~enemy_attacks:
+                return 2
+
+        own_distance = ThreatDetector._min_distance(own, moves_down)
+        enemy_distance = ThreatDetector._min_distance(enemy, not moves_down)
+
+        # Moving first, a runner that arrives no later than the enemy's
+        # fastest piece wins the race
+        runner = ThreatDetector._runner_distance(
+            own, enemy, CONE_MASKS[player], moves_down, enemy_distance
+        )
+        if runner:
+            return runner
+
+        # Moving second, the enemy's runner has to be strictly faster
+        runner = ThreatDetector._runner_distance(
+            enemy,
+            own,
+            CONE_MASKS[opponent],
+            not moves_down,
+            own_distance - 1,
+        )
+        if runner:
+            return -runner
+
+        return 0
+
+    @staticmethod
+    def plies_to_result(forced: int) -> int:
+        """Plies, counting both sides' moves, until a forced result is reached."""
+        return 2 * forced - 1 if forced > 0 else -2 * forced
+
+    @staticmethod
+    def _min_distance(pieces: int, moves_down: bool) -> int:
+        if not pieces:
+            return BOARD_SIZE
+        if moves_down:
+            return (BOARD_SIZE - 1) - ((pieces.bit_length() - 1) >> 3)
+        return ((pieces & -pieces).bit_length() - 1) >> 3
+
+    @staticmethod
+    def _runner_distance(
+        pieces: int, defenders: int, cones: tuple, moves_down: bool, max_distance: int
+    ) -> int:
+        """Distance of the closest piece no defender can reach, or 0."""
+        if max_distance <= 0:
+            return 0
+        candidates = pieces & WITHIN_ROWS[moves_down][min(max_distance, BOARD_SIZE)]
+
+        # Closest to the goal first: high squares when moving down
+        while candidates:
+            if moves_down:
+                sq = candidates.bit_length() - 1
+            else:
+                sq = (candidates & -candidates).bit_length() - 1
+            candidates ^= 1 << sq
+            if not cones[sq] & defenders:
+                if moves_down:
+                    return (BOARD_SIZE - 1) - (sq >> 3)
+                return sq >> 3
+        return 0
@@ -0,0 +1,28 @@
+import random
+
+from model.game_state import GameState
+
+# Fixed seed so every process derives the same keys for the same position
+_rng = random.Random(0x42524B54)
+
+PIECE_KEYS = {
+    GameState.WHITE: [_rng.getrandbits(64) for _ in range(64)],
+    GameState.BLACK: [_rng.getrandbits(64) for _ in range(64)],
+}
+SIDE_KEY = _rng.getrandbits(64)  # Mixed in when Black is to move
+
+
+def compute_hash(white: int, black: int, current_player: int) -> int:
+    key = 0
+
+    for player, pieces in ((GameState.WHITE, white), (GameState.BLACK, black)):
+        table = PIECE_KEYS[player]
+        while pieces:
+            low = pieces & -pieces
+            pieces ^= low
+            key ^= table[low.bit_length() - 1]
+
+    if current_player == GameState.BLACK:
+        key ^= SIDE_KEY
+
+    return key
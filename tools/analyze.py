@@ -0,0 +1,249 @@
+"""Batch analysis of positions streamed from a file, one per line.
+
+Usage:
+    python -m tools.analyze positions.txt --depth 6 --output analysis.jsonl
+    python -m tools.analyze - --time 0.5 --output analysis.jsonl < positions.txt
+
+Each line holds a position the way the engine server's position command
+takes it, without the word "position":
+    startpos moves a2a3 b7b6
+    fen WWWWWWWW/WWWWWWWW/8/8/8/8/BBBBBBBB/BBBBBBBB w -
+    board <8 rows of W/B/. joined by "/"> <white|black> [moves ...]
+Blank lines and lines starting with # are skipped.
+
+Every position is searched from empty tables by a pool of worker
+processes, within the --depth, --time and --nodes limits. Results go to
+the output file as JSON lines keyed by input line number: the position
+searched in the fen text form, score, best move, pv, completed depth,
+nodes and time. They are written in input order, or as they finish with
+--unordered. Only a few positions per worker are read ahead, so memory
+doesn't grow with the input. Rerunning with the same output file and
+settings skips positions already analysed.
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from typing import Iterable, Iterator, List, Optional, Set, Tuple
+
+from controller.ai_algorithm import MinimaxAlgorithm
+from model import GameRules, GameState, PositionSerializer
+from model.moves import move_to_text
+from tools.positions import parse_position
+from tools.results import SettingsMismatchError, iter_records, open_for_append
+
+# Depth for runs given no limit at all
+DEFAULT_DEPTH = 4
+# Positions in flight (and, in input order, waiting to be written) per worker
+JOBS_PER_WORKER = 4
+PROGRESS_INTERVAL = 100
+
+# Each worker process keeps one engine and clears it between positions,
+# so a result doesn't depend on which worker searched it
+_worker_algorithm = None
+
+
+def _init_worker(engine: dict) -> None:
+    global _worker_algorithm
+    _worker_algorithm = MinimaxAlgorithm(
+        quiescence_budget=engine["quiescence"],
+        late_move_reductions=engine["lmr"],
+        futility_pruning=engine["futility"],
+    )
+
+
+def analyze_position(data: bytes, limits: dict) -> dict:
+    state = PositionSerializer.from_bytes(data)
+    record = {"fen": PositionSerializer.to_text(state)}
+
+    winner = GameRules.get_winner(state)
+    if winner is not None:
+        record["winner"] = "white" if winner == GameState.WHITE else "black"
+        record["best_move"] = None
+        return record
+
+    algorithm = _worker_algorithm
+    algorithm.new_game()
+    time_limit = limits["time"]
+    start = time.perf_counter()
+    score, move = algorithm.iterative_deepening(
+        state,
+        state.current_player,
+        limits["depth"],
+        soft_time_limit=(
+            time_limit * MinimaxAlgorithm.SOFT_LIMIT_FRACTION if time_limit else None
+        ),
+        hard_time_limit=time_limit,
+        node_limit=limits["nodes"],
+    )
+
+    record.update(
+        score=score,
+        best_move=move_to_text(move) if move is not None else None,
+        pv=[move_to_text(m) for m in algorithm.principal_variation],
+        depth=algorithm.completed_depth,
+        nodes=algorithm.get_nodes_visited() + algorithm.get_quiescence_nodes(),
+        time=time.perf_counter() - start,
+    )
+    return record
+
+
+def _submit(executor: ProcessPoolExecutor, text: str, limits: dict) -> Future:
+    # Parsed here, so workers get the fixed-size binary form
+    try:
+        state = parse_position(text.split())
+    except ValueError as error:
+        # Unreadable lines still take their place in the output
+        future = Future()
+        future.set_result({"error": str(error)})
+        return future
+    data = PositionSerializer.to_bytes(state)
+    return executor.submit(analyze_position, data, limits)
+
+
+def _positions(lines: Iterable[str], done: Set[int]) -> Iterator[Tuple[int, str]]:
+    for number, line in enumerate(lines, 1):
+        text = line.strip()
+        if not text or text.startswith("#") or number in done:
+            continue
+        yield number, text
+
+
+def run_analysis(
+    lines: Iterable[str],
+    output_path: str,
+    limits: dict,
+    engine: dict,
+    workers: Optional[int] = None,
+    ordered: bool = True,
+) -> dict:
+    settings = {**limits, **engine}
+    # Only the line numbers are kept, however large the output has grown
+    done = {record["line"] for record in iter_records(output_path, settings)}
+    positions = _positions(lines, done)
+    workers = workers or os.cpu_count() or 1
+    window = workers * JOBS_PER_WORKER
+
+    written = errors = 0
+    start = time.perf_counter()
+    with open_for_append(output_path, settings) as out:
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_worker, initargs=(engine,)
+        ) as executor:
+            # Futures to their submission order and input line, and in
+            # input order the results held back until everything before
+            # them is written
+            in_flight = {}
+            held = {}
+            submitted = 0
+            exhausted = False
+
+            while True:
+                while not exhausted and len(in_flight) + len(held) < window:
+                    item = next(positions, None)
+                    if item is None:
+                        exhausted = True
+                        break
+                    number, text = item
+                    future = _submit(executor, text, limits)
+                    in_flight[future] = (submitted, number, text)
+                    submitted += 1
+                if not in_flight:
+                    break
+
+                finished, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                ready = []
+                for future in finished:
+                    order, number, text = in_flight.pop(future)
+                    record = {"line": number, "position": text, **future.result()}
+                    if ordered:
+                        held[order] = record
+                    else:
+                        ready.append(record)
+                while written + len(ready) in held:
+                    ready.append(held.pop(written + len(ready)))
+
+                for record in ready:
+                    out.write(json.dumps(record) + "\n")
+                    errors += "error" in record
+                    written += 1
+                    if written % PROGRESS_INTERVAL == 0:
+                        elapsed = time.perf_counter() - start
+                        print(
+                            f"{written} positions, {written / elapsed:.1f}/s",
+                            flush=True,
+                        )
+                out.flush()
+
+    return {
+        "positions": written,
+        "errors": errors,
+        "skipped": len(done),
+        "time": time.perf_counter() - start,
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description=__doc__.splitlines()[0],
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="\n".join(__doc__.splitlines()[2:]),
+    )
+    parser.add_argument("input", help="positions file, or - for stdin")
+    parser.add_argument("--output", required=True, help="append-only JSONL file")
+    parser.add_argument("--depth", type=int, default=None)
+    parser.add_argument("--time", type=float, default=None, help="seconds each")
+    parser.add_argument("--nodes", type=int, default=None)
+    parser.add_argument(
+        "--quiescence",
+        type=int,
+        default=MinimaxAlgorithm.QUIESCENCE_NODE_BUDGET,
+        help="node budget per leaf, 0 to disable",
+    )
+    parser.add_argument("--no-lmr", action="store_true")
+    parser.add_argument("--no-futility", action="store_true")
+    parser.add_argument(
+        "--unordered", action="store_true", help="write results as they finish"
+    )
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    depth = args.depth
+    if depth is None:
+        # A time or node limit alone searches as deep as it allows
+        limited = args.time is not None or args.nodes is not None
+        depth = MinimaxAlgorithm.MAX_TIMED_DEPTH if limited else DEFAULT_DEPTH
+    limits = {"depth": depth, "time": args.time, "nodes": args.nodes}
+    engine = {
+        "quiescence": args.quiescence,
+        "lmr": not args.no_lmr,
+        "futility": not args.no_futility,
+    }
+
+    source = sys.stdin if args.input == "-" else open(args.input)
+    try:
+        with source:
+            summary = run_analysis(
+                source,
+                args.output,
+                limits,
+                engine,
+                workers=args.workers,
+                ordered=not args.unordered,
+            )
+    except SettingsMismatchError as error:
+        print(error, file=sys.stderr)
+        return 1
+
+    print(
+        f"Analysed {summary['positions']} positions in {summary['time']:.1f}s "
+        f"({summary['errors']} unreadable, {summary['skipped']} already done)"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,657 @@
+"""Headless engine benchmarks: perft, fixed-depth searches and micro-benchmarks.
+
+Usage:
+    python -m tools.benchmark run [--output results.json]
+    python -m tools.benchmark compare baseline.json current.json
+    python -m tools.benchmark verify [--positions 500]
+    python -m tools.benchmark profile [--depth 5] [--output stats.json]
+    python -m tools.benchmark selective [--time 1.0] [--depth 6] [--output sel.json]
+"""
+
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+import timeit
+from typing import List, Optional
+
+from controller.ai_algorithm import MinimaxAlgorithm
+from controller.parallel_search import ParallelSearch
+from model import (
+    BitboardState,
+    GameRules,
+    GameState,
+    MoveValidator,
+    PositionEvaluator,
+    PositionSerializer,
+    decode_move,
+)
+
+# In the model's orientation: White starts on rows 0-1 and moves down.
+# "W"/"B" are pieces and "." is empty.
+CURATED_POSITIONS = {
+    "opening": [
+        "WWWWWWWW",
+        "WWWWWWWW",
+        "........",
+        "........",
+        "........",
+        "........",
+        "BBBBBBBB",
+        "BBBBBBBB",
+    ],
+    "early": [
+        "WW.WWWWW",
+        "W.WWWW.W",
+        "W....W..",
+        "...W....",
+        "........",
+        "B.B.BBB.",
+        ".B.B...B",
+        "BBBBBBBB",
+    ],
+    "midgame": [
+        "W.WWWWWW",
+        ".W..W..W",
+        "W.W..W.W",
+        "..W.....",
+        "...B....",
+        ".BB.BBBB",
+        "BB...B..",
+        "B.BBB.BB",
+    ],
+    "tactical": [
+        ".WWW.WWW",
+        "W.W..W..",
+        "..W..WW.",
+        ".W.BBW..",
+        "B......B",
+        ".BBBW...",
+        "...B.BB.",
+        "BBB..BBB",
+    ],
+    "race": [
+        "W.W.W..W",
+        ".WW...WW",
+        "B..WWW..",
+        "BWB..WBW",
+        "........",
+        "...B..B.",
+        ".BBBWBBB",
+        "..B...BB",
+    ],
+}
+
+PIECE_SYMBOLS = {".": GameState.EMPTY, "W": GameState.WHITE, "B": GameState.BLACK}
+
+# Flag a slowdown when throughput drops by more than this fraction
+DEFAULT_REGRESSION_THRESHOLD = 0.10
+# Runs shorter than this are too noisy to compare for speed
+MIN_COMPARABLE_TIME = 0.05
+
+# Random games verify plays through and back to check the incremental
+# evaluator at every ply
+VERIFY_EVALUATION_GAMES = 50
+# Depth at which verify checks parallel search against serial on wins
+VERIFY_PARALLEL_DEPTH = 4
+
+# Selective-search settings compared by `selective`, the first being the
+# full-width reference the others are checked against
+SELECTIVE_VARIANTS = {
+    "full-width": {"late_move_reductions": False, "futility_pruning": False},
+    "lmr": {"late_move_reductions": True, "futility_pruning": False},
+    "futility": {"late_move_reductions": False, "futility_pruning": True},
+    "both": {"late_move_reductions": True, "futility_pruning": True},
+}
+
+
+def state_from_rows(
+    rows: List[str], current_player: int = GameState.WHITE
+) -> GameState:
+    state = GameState([[PIECE_SYMBOLS[symbol] for symbol in row] for row in rows])
+    state.current_player = current_player
+    return state
+
+
+def opening_state() -> GameState:
+    state = GameState()
+    GameRules.setup_initial_position(state)
+    return state
+
+
+def perft(position: BitboardState, depth: int) -> int:
+    if depth == 0:
+        return 1
+
+    moves = MoveValidator.get_all_valid_moves_bitboard(
+        position, position.current_player
+    )
+    if depth == 1:
+        return len(moves)
+
+    nodes = 0
+    for move in moves:
+        undo = position.make_move(move)
+        # A finished game has no further leaves
+        if position.winner is None:
+            nodes += perft(position, depth - 1)
+        position.unmake_move(move, undo)
+    return nodes
+
+
+def run_perft(max_depth: int) -> List[dict]:
+    results = []
+    position = BitboardState.from_game_state(opening_state())
+
+    for depth in range(1, max_depth + 1):
+        start = time.perf_counter()
+        nodes = perft(position, depth)
+        elapsed = time.perf_counter() - start
+
+        results.append(
+            {
+                "depth": depth,
+                "nodes": nodes,
+                "time": elapsed,
+                "nodes_per_second": nodes / elapsed if elapsed > 0 else 0.0,
+            }
+        )
+
+    return results
+
+
+def run_searches(depth: int) -> List[dict]:
+    results = []
+
+    for name, rows in CURATED_POSITIONS.items():
+        state = state_from_rows(rows)
+
+        # A fresh engine per position keeps runs independent of each other
+        algorithm = MinimaxAlgorithm()
+        start = time.perf_counter()
+        score, best_move = algorithm.find_best_move(state, state.current_player, depth)
+        elapsed = time.perf_counter() - start
+        nodes = algorithm.get_nodes_visited()
+        quiescence_nodes = algorithm.get_quiescence_nodes()
+
+        results.append(
+            {
+                "position": name,
+                "depth": depth,
+                "nodes": nodes,
+                "quiescence_nodes": quiescence_nodes,
+                "time": elapsed,
+                "nodes_per_second": (
+                    (nodes + quiescence_nodes) / elapsed if elapsed > 0 else 0.0
+                ),
+                "score": score,
+                "best_move": (
+                    list(decode_move(best_move)) if best_move is not None else None
+                ),
+            }
+        )
+
+    return results
+
+
+def run_profile(depth: int) -> dict:
+    """Instrumented searches of the curated positions, with phase timing."""
+    profiles = {}
+
+    for name, rows in CURATED_POSITIONS.items():
+        state = state_from_rows(rows)
+        algorithm = MinimaxAlgorithm(instrument=True)
+        algorithm.iterative_deepening(state, state.current_player, depth)
+        profiles[name] = algorithm.get_search_stats()
+
+    return profiles
+
+
+def run_selective(time_limit: float, depth: int) -> List[dict]:
+    """Each selective-search variant of the engine against the full-width one.
+
+    For every curated position: the depth a variant completes within
+    time_limit seconds, and its move, score and node count at a fixed
+    depth next to the full-width search's move and score.
+    """
+    results = []
+
+    for name, rows in CURATED_POSITIONS.items():
+        state = state_from_rows(rows)
+        player = state.current_player
+        reference = None
+
+        for variant, options in SELECTIVE_VARIANTS.items():
+            algorithm = MinimaxAlgorithm(**options)
+            start = time.perf_counter()
+            score, best_move = algorithm.iterative_deepening(state, player, depth)
+            elapsed = time.perf_counter() - start
+            nodes = algorithm.get_nodes_visited() + algorithm.get_quiescence_nodes()
+            best_move = list(decode_move(best_move)) if best_move is not None else None
+            if reference is None:
+                reference = (score, best_move)
+
+            timed = MinimaxAlgorithm(**options)
+            timed.iterative_deepening(
+                state,
+                player,
+                MinimaxAlgorithm.MAX_TIMED_DEPTH,
+                hard_time_limit=time_limit,
+            )
+
+            results.append(
+                {
+                    "position": name,
+                    "variant": variant,
+                    "depth": depth,
+                    "nodes": nodes,
+                    "time": elapsed,
+                    "score": score,
+                    "best_move": best_move,
+                    "full_width_score": reference[0],
+                    "full_width_move": reference[1],
+                    "time_limit": time_limit,
+                    "depth_in_time": timed.completed_depth,
+                }
+            )
+
+    return results
+
+
+def run_micro_benchmarks(repeat: int = 5) -> List[dict]:
+    state = state_from_rows(CURATED_POSITIONS["midgame"])
+    player = state.current_player
+
+    cases = {
+        "GameState.copy": lambda: state.copy(),
+        "MoveValidator.get_all_valid_moves": (
+            lambda: MoveValidator.get_all_valid_moves(state, player)
+        ),
+        "PositionEvaluator.evaluate": (
+            lambda: PositionEvaluator.evaluate(state, player)
+        ),
+    }
+
+    results = []
+    for name, func in cases.items():
+        timer = timeit.Timer(func)
+        number, _ = timer.autorange()
+        best = min(timer.repeat(repeat=repeat, number=number)) / number
+
+        results.append(
+            {
+                "name": name,
+                "usec_per_op": best * 1e6,
+                "ops_per_second": 1.0 / best if best > 0 else 0.0,
+            }
+        )
+
+    return results
+
+
+def run_benchmarks(perft_depth: int, search_depth: int) -> dict:
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "perft": run_perft(perft_depth),
+        "search": run_searches(search_depth),
+        "micro": run_micro_benchmarks(),
+    }
+
+
+def compare_results(baseline: dict, current: dict, threshold: float) -> List[str]:
+    problems = []
+
+    # Older results also ran perft on the mirrored board the model used to
+    # support; its white_down runs are the ones in today's orientation
+    baseline_perft = {
+        r["depth"]: r
+        for r in baseline["perft"]
+        if r.get("orientation", "white_down") == "white_down"
+    }
+    for result in current["perft"]:
+        old = baseline_perft.get(result["depth"])
+        if old is None:
+            continue
+        if old["nodes"] != result["nodes"]:
+            problems.append(
+                f"perft depth {result['depth']}: "
+                f"{old['nodes']} -> {result['nodes']} leaves (move generation changed)"
+            )
+        if old["time"] < MIN_COMPARABLE_TIME:
+            continue
+        problems.extend(
+            _speed_regression(
+                f"perft depth {result['depth']}",
+                old["nodes_per_second"],
+                result["nodes_per_second"],
+                threshold,
+            )
+        )
+
+    baseline_search = {(r["position"], r["depth"]): r for r in baseline["search"]}
+    for result in current["search"]:
+        old = baseline_search.get((result["position"], result["depth"]))
+        if old is None:
+            continue
+        label = f"search {result['position']} depth {result['depth']}"
+        if old["best_move"] != result["best_move"]:
+            problems.append(
+                f"{label}: best move {old['best_move']} -> {result['best_move']}"
+            )
+        if old["time"] < MIN_COMPARABLE_TIME:
+            continue
+        problems.extend(
+            _speed_regression(
+                label, old["nodes_per_second"], result["nodes_per_second"], threshold
+            )
+        )
+
+    baseline_micro = {r["name"]: r for r in baseline["micro"]}
+    for result in current["micro"]:
+        old = baseline_micro.get(result["name"])
+        if old is None:
+            continue
+        problems.extend(
+            _speed_regression(
+                result["name"],
+                old["ops_per_second"],
+                result["ops_per_second"],
+                threshold,
+            )
+        )
+
+    return problems
+
+
+def _speed_regression(
+    label: str, old_rate: float, new_rate: float, threshold: float
+) -> List[str]:
+    if old_rate <= 0 or new_rate >= old_rate * (1.0 - threshold):
+        return []
+    change = (new_rate - old_rate) / old_rate
+    return [f"{label}: {old_rate:,.0f}/s -> {new_rate:,.0f}/s ({change:+.1%})"]
+
+
+def verify_bitboard_paths(positions: int, seed: int = 0) -> List[str]:
+    """Differential check of the bitboard paths and serialized forms against
+    the list-based model.
+    """
+    rng = random.Random(seed)
+    problems = []
+
+    for index in range(positions):
+        state = opening_state()
+        position = BitboardState.from_game_state(state)
+
+        # Random playout, making moves on both representations in lockstep
+        for _ in range(rng.randint(0, 60)):
+            moves = MoveValidator.get_all_valid_moves(state, state.current_player)
+            if not moves or state.winner is not None:
+                break
+            move = rng.choice(moves)
+            GameRules.execute_move(state, *decode_move(move))
+            position.make_move(move)
+
+        # Both serialized forms must give back the same GameState
+        text = PositionSerializer.to_text(state)
+        data = PositionSerializer.to_bytes(state)
+        if data != PositionSerializer.bitboard_to_bytes(position):
+            problems.append(f"position {index}: binary forms differ")
+        for form, restored in (
+            ("text", PositionSerializer.from_text(text)),
+            ("binary", PositionSerializer.from_bytes(data)),
+        ):
+            if (restored.board, restored.current_player, restored.winner) != (
+                state.board,
+                state.current_player,
+                state.winner,
+            ):
+                problems.append(f"position {index}: {form} round trip differs")
+
+        for player in (GameState.WHITE, GameState.BLACK):
+            expected_moves = MoveValidator.get_all_valid_moves(state, player)
+            actual_moves = MoveValidator.get_all_valid_moves_bitboard(position, player)
+            if expected_moves != actual_moves:
+                problems.append(f"position {index}: move lists differ for {player}")
+
+    return problems
+
+
+def verify_incremental_evaluation(games: int, seed: int = 0) -> List[str]:
+    """Differential check of the incremental evaluator against evaluate.
+
+    Every position of a random game is compared on the way down, through
+    make_move, and again on the way back up, through unmake_move.
+    """
+    rng = random.Random(seed)
+    problems = []
+
+    def compare(game: int, ply: int, state: GameState, position: BitboardState):
+        fresh = BitboardState.from_game_state(state)
+        if (position.white_advancement, position.black_advancement) != (
+            fresh.white_advancement,
+            fresh.black_advancement,
+        ):
+            problems.append(f"game {game} ply {ply}: advancement drifted")
+        for player in (GameState.WHITE, GameState.BLACK):
+            expected = PositionEvaluator.evaluate(state, player)
+            actual = PositionEvaluator.evaluate_bitboard(position, player)
+            if expected != actual:
+                problems.append(
+                    f"game {game} ply {ply}: evaluate {expected} != {actual} "
+                    f"for {player}"
+                )
+
+    for game in range(games):
+        state = opening_state()
+        position = BitboardState.from_game_state(state)
+        history = []
+
+        while state.winner is None:
+            moves = MoveValidator.get_all_valid_moves(state, state.current_player)
+            if not moves:
+                break
+            move = rng.choice(moves)
+            history.append((move, position.make_move(move), state.copy()))
+            GameRules.execute_move(state, *decode_move(move))
+            compare(game, len(history), state, position)
+
+        while history:
+            move, undo, state = history.pop()
+            position.unmake_move(move, undo)
+            compare(game, len(history), state, position)
+
+    return problems
+
+
+def verify_parallel_wins(depth: int) -> List[str]:
+    """Root-split search must play the serial engine's winning moves.
+
+    Both order wins first and keep the first of equal scores, so even
+    between equally fast wins they agree.
+    """
+    problems = []
+    parallel = ParallelSearch(workers=2)
+    try:
+        for name, rows in CURATED_POSITIONS.items():
+            state = state_from_rows(rows)
+            player = state.current_player
+            serial = MinimaxAlgorithm()
+            expected, expected_move = serial.iterative_deepening(state, player, depth)
+            if abs(expected) < MinimaxAlgorithm.PROVEN_SCORE:
+                continue
+
+            score, move = parallel.iterative_deepening(state, player, depth)
+            if (score, move) != (expected, expected_move):
+                problems.append(
+                    f"{name}: parallel plays {decode_move(move)} ({score}), "
+                    f"serial {decode_move(expected_move)} ({expected})"
+                )
+    finally:
+        parallel.shutdown(wait=True)
+    return problems
+
+
+def _print_report(results: dict) -> None:
+    for r in results["perft"]:
+        print(
+            f"perft d{r['depth']}: {r['nodes']:>10,} leaves "
+            f"{r['time']:8.3f}s {r['nodes_per_second']:>12,.0f}/s"
+        )
+    for r in results["search"]:
+        print(
+            f"search {r['position']:>9} d{r['depth']}: {r['nodes']:>10,} nodes "
+            f"+{r.get('quiescence_nodes', 0):>9,} quiescence "
+            f"{r['time']:8.3f}s {r['nodes_per_second']:>12,.0f}/s "
+            f"score {r['score']:+.1f} best {r['best_move']}"
+        )
+    for r in results["micro"]:
+        print(f"micro {r['name']:>34}: {r['usec_per_op']:10.2f} us/op")
+
+
+def _print_profile(profiles: dict) -> None:
+    for name, stats in profiles.items():
+        ebf = stats["effective_branching_factor"]
+        ebf = f"{ebf:.2f}" if ebf is not None else "—"
+        print(f"{name}: effective branching factor {ebf}")
+        for r in stats["depths"]:
+            print(
+                f"  d{r['depth']}: {r['nodes']:>9,} nodes "
+                f"({r['interior_nodes']:,} interior, {r['leaf_nodes']:,} leaves) "
+                f"+{r['quiescence_nodes']:>9,} quiescence, "
+                f"first-move cutoffs {r['first_move_cutoff_rate']:.0%}, "
+                f"TT hits {r['tt_hit_rate']:.0%}, "
+                f"{r['reductions']:,} reduced ({r['reduction_researches']:,} "
+                f"re-searched), {r['futility_prunes']:,} futility-pruned, "
+                f"{r['time']:.3f}s"
+            )
+        total = sum(r["time"] for r in stats["depths"])
+        phases = ", ".join(
+            f"{phase} {seconds / total:.0%}" if total else f"{phase} 0%"
+            for phase, seconds in stats["phase_times"].items()
+        )
+        print(f"  time: {phases}")
+
+
+def _print_selective(results: List[dict]) -> None:
+    for r in results:
+        # Equal scores mean a tie broken differently, not a weaker move
+        match = ""
+        if r["best_move"] != r["full_width_move"]:
+            match = (
+                f"  (full-width: {r['full_width_move']} "
+                f"{r['full_width_score']:+.1f})"
+            )
+        print(
+            f"{r['position']:>9} {r['variant']:>10}: "
+            f"depth {r['depth_in_time']:>2} in {r['time_limit']:g}s | "
+            f"d{r['depth']} {r['nodes']:>9,} nodes {r['time']:7.3f}s "
+            f"score {r['score']:+.1f} best {r['best_move']}{match}"
+        )
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser("run", help="run the benchmark suite")
+    run_parser.add_argument("--perft-depth", type=int, default=4)
+    run_parser.add_argument("--search-depth", type=int, default=4)
+    run_parser.add_argument("--output", help="write results as JSON to this file")
+
+    compare_parser = subparsers.add_parser(
+        "compare", help="flag regressions between two result files"
+    )
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_REGRESSION_THRESHOLD,
+        help="allowed fractional drop in throughput (default 0.10)",
+    )
+
+    verify_parser = subparsers.add_parser(
+        "verify", help="cross-check bitboard paths against GameState on random games"
+    )
+    verify_parser.add_argument("--positions", type=int, default=500)
+    verify_parser.add_argument("--seed", type=int, default=0)
+
+    profile_parser = subparsers.add_parser(
+        "profile", help="per-depth search statistics with phase timing"
+    )
+    profile_parser.add_argument("--depth", type=int, default=5)
+    profile_parser.add_argument(
+        "--output", help="write statistics as JSON to this file"
+    )
+
+    selective_parser = subparsers.add_parser(
+        "selective",
+        help="depth reached in fixed time, with and without selective search",
+    )
+    selective_parser.add_argument(
+        "--time", type=float, default=1.0, help="seconds per timed search"
+    )
+    selective_parser.add_argument(
+        "--depth", type=int, default=6, help="depth of the fixed-depth searches"
+    )
+    selective_parser.add_argument(
+        "--output", help="write results as JSON to this file"
+    )
+
+    args = parser.parse_args(argv)
+
+    if args.command == "verify":
+        problems = verify_bitboard_paths(args.positions, args.seed)
+        problems += verify_incremental_evaluation(
+            VERIFY_EVALUATION_GAMES, args.seed
+        )
+        problems += verify_parallel_wins(VERIFY_PARALLEL_DEPTH)
+        for problem in problems:
+            print(problem)
+        print(f"{args.positions} positions checked, {len(problems)} mismatches.")
+        return 1 if problems else 0
+
+    if args.command == "profile":
+        profiles = run_profile(args.depth)
+        _print_profile(profiles)
+        if args.output:
+            with open(args.output, "w") as f:
+                json.dump(profiles, f, indent=2)
+        return 0
+
+    if args.command == "selective":
+        results = run_selective(args.time, args.depth)
+        _print_selective(results)
+        if args.output:
+            with open(args.output, "w") as f:
+                json.dump(results, f, indent=2)
+        return 0
+
+    if args.command == "run":
+        results = run_benchmarks(args.perft_depth, args.search_depth)
+        _print_report(results)
+        if args.output:
+            with open(args.output, "w") as f:
+                json.dump(results, f, indent=2)
+        return 0
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    with open(args.current) as f:
+        current = json.load(f)
+
+    problems = compare_results(baseline, current, args.threshold)
+    for problem in problems:
+        print(problem)
+    if not problems:
+        print("No regressions.")
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
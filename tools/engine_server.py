@@ -0,0 +1,395 @@
+"""Headless engine server speaking a line-based protocol.
+
+Usage:
+    python -m tools.engine_server                       # one session on stdin
+    python -m tools.engine_server --socket /tmp/bt.sock # one per connection
+
+Commands, one per line:
+    position startpos [moves a2a3 b7b6 ...]
+    position fen <rows> <w|b> <winner|-> [moves ...]
+    position board <8 rows of W/B/. joined by "/"> <white|black> [moves ...]
+    setoption <name> <value>      depth, time, nodes, quiescence, lmr, futility
+    go [depth N] [time SECONDS] [nodes N] [infinite]
+    stop
+    isready
+    newgame
+    quit
+
+A search answers with one info line per completed depth, then bestmove:
+    info depth 5 score 140 nodes 31303 nps 117511 time 266 pv a2a3 g7g6 ...
+    bestmove a2a3
+
+Moves are written from-square then to-square, files a-h by column and
+ranks 1-8 by row; White starts on ranks 1-2 and moves up the ranks.
+Each session searches on its own thread with its own engine, so games
+run side by side; all of them share one warm transposition table.
+"""
+
+import argparse
+import os
+import signal
+import socketserver
+import sys
+import threading
+import time
+from typing import Callable, List, Optional
+
+from controller.ai_algorithm import MinimaxAlgorithm
+from controller.transposition import TranspositionTable
+from model import GameRules, GameState
+from model.moves import move_to_text
+from tools.positions import parse_position, start_position
+
+# Session options and how to read their values; None means no limit
+DEFAULT_OPTIONS = {
+    "depth": 5,
+    "time": None,
+    "nodes": None,
+    "quiescence": MinimaxAlgorithm.QUIESCENCE_NODE_BUDGET,
+    "lmr": True,
+    "futility": True,
+}
+OPTION_TYPES = {
+    "depth": int,
+    "time": float,
+    "nodes": int,
+    "quiescence": int,
+    "lmr": lambda value: bool(int(value)),
+    "futility": lambda value: bool(int(value)),
+}
+
+
+class ProtocolError(Exception):
+    pass
+
+
+class SearchRequest:
+    def __init__(
+        self,
+        session: "Session",
+        algorithm: MinimaxAlgorithm,
+        state: GameState,
+        limits: dict,
+    ):
+        self.session = session
+        self.algorithm = algorithm
+        self.state = state
+        self.limits = limits
+        # Set by stop; a request stopped before it runs still answers,
+        # from a depth-1 search
+        self.stopped = False
+        self.thread = None
+        self.done = threading.Event()
+
+    def stop(self) -> None:
+        # Marked first, so the search sees it whichever side of starting
+        # it is on
+        self.stopped = True
+        self.algorithm.stop()
+
+
+class EngineServer:
+    """What every session shares: one transposition table.
+
+    Each session searches on its own thread with its own engine, so one
+    client's long search doesn't hold up another's. The engines share the
+    table, which is keyed by position and stores scores relative to the
+    node, so games warm it for each other safely.
+    """
+
+    def __init__(self, tt_size_mb: float = TranspositionTable.DEFAULT_SIZE_MB):
+        self.transposition_table = TranspositionTable(tt_size_mb)
+        self.lock = threading.Lock()
+        self.running = set()
+
+    def new_engine(self) -> MinimaxAlgorithm:
+        return MinimaxAlgorithm(transposition_table=self.transposition_table)
+
+    def start(self, request: SearchRequest, search: Callable) -> None:
+        request.thread = threading.Thread(target=search, args=(request,), daemon=True)
+        with self.lock:
+            self.running.add(request)
+        request.thread.start()
+
+    def finished(self, request: SearchRequest) -> None:
+        with self.lock:
+            self.running.discard(request)
+
+    def close(self) -> None:
+        with self.lock:
+            running = list(self.running)
+        for request in running:
+            request.stop()
+        for request in running:
+            request.thread.join()
+
+
+class Session:
+    """One game's position and options, and where its replies go."""
+
+    def __init__(self, server: EngineServer, write: Callable[[str], None]):
+        self.server = server
+        self.write = write
+        self.write_lock = threading.Lock()
+        self.closed = False
+
+        self.algorithm = server.new_engine()
+        self.state = start_position()
+        self.options = dict(DEFAULT_OPTIONS)
+        # The default depth gives way to a time or node limit; a set one
+        # doesn't
+        self.depth_set = False
+        self.search = None
+
+    def send(self, line: str) -> None:
+        # The search thread writes info lines while this session's own
+        # thread answers commands
+        with self.write_lock:
+            if self.closed:
+                return
+            try:
+                self.write(line + "\n")
+            except OSError:
+                self.closed = True
+
+    def finish(self, request: SearchRequest, line: str) -> None:
+        # Idle before the reply goes out, so the client can go again
+        if self.search is request:
+            self.search = None
+        self.send(line)
+        request.done.set()
+
+    def drain(self) -> None:
+        """Wait for the search in progress to answer, at end of input."""
+        search = self.search
+        if search is not None:
+            search.done.wait()
+
+    def handle(self, line: str) -> bool:
+        """Run one command; False once the session should end."""
+        words = line.split()
+        if not words:
+            return True
+        command, args = words[0], words[1:]
+
+        try:
+            if command == "quit":
+                self.close()
+                return False
+            if command == "isready":
+                self.send("readyok")
+            elif command == "newgame":
+                self._require_idle()
+                self.state = start_position()
+            elif command == "position":
+                self._require_idle()
+                try:
+                    self.state = parse_position(args)
+                except ValueError as error:
+                    raise ProtocolError(str(error)) from None
+            elif command == "setoption":
+                self._set_option(args)
+            elif command == "go":
+                self._require_idle()
+                self._go(args)
+            elif command == "stop":
+                if self.search is not None:
+                    self.search.stop()
+            else:
+                raise ProtocolError(f"unknown command {command!r}")
+        except ProtocolError as error:
+            self.send(f"error {error}")
+        return True
+
+    def close(self) -> None:
+        if self.search is not None:
+            self.search.stop()
+        with self.write_lock:
+            self.closed = True
+
+    def _require_idle(self) -> None:
+        if self.search is not None:
+            raise ProtocolError("search in progress")
+
+    def _set_option(self, args: List[str]) -> None:
+        if len(args) != 2 or args[0] not in OPTION_TYPES:
+            raise ProtocolError(
+                "setoption <name> <value>, name one of " + ", ".join(OPTION_TYPES)
+            )
+        name, value = args
+        if value == "none" and DEFAULT_OPTIONS[name] is None:
+            self.options[name] = None
+            return
+        try:
+            self.options[name] = OPTION_TYPES[name](value)
+        except ValueError:
+            raise ProtocolError(f"bad value for {name}: {value!r}") from None
+        if name == "depth":
+            self.depth_set = True
+
+    def _go(self, args: List[str]) -> None:
+        limits = dict(self.options)
+
+        # Limits given with go replace the session's for this search only
+        given = {}
+        words = iter(args)
+        for word in words:
+            if word == "infinite":
+                given.update(
+                    depth=MinimaxAlgorithm.MAX_TIMED_DEPTH, time=None, nodes=None
+                )
+            elif word in ("depth", "time", "nodes"):
+                value = next(words, None)
+                try:
+                    given[word] = OPTION_TYPES[word](value)
+                except (TypeError, ValueError):
+                    raise ProtocolError(f"bad value for {word}: {value!r}") from None
+            else:
+                raise ProtocolError(f"unknown go argument {word!r}")
+        limits.update(given)
+
+        # A time or node limit without a depth searches as deep as it
+        # allows, whether both came with go or both from setoption
+        depth_set = "depth" in given if given else self.depth_set
+        limited = limits["time"] is not None or limits["nodes"] is not None
+        if limited and not depth_set:
+            limits["depth"] = MinimaxAlgorithm.MAX_TIMED_DEPTH
+
+        if GameRules.is_game_over(self.state):
+            self.send("bestmove none")
+            return
+
+        # Cleared before the thread starts, so a stop sent right after go
+        # still lands
+        self.algorithm.stop_requested = False
+        self.search = SearchRequest(self, self.algorithm, self.state.copy(), limits)
+        self.server.start(self.search, self._search)
+
+    def _search(self, request: SearchRequest) -> None:
+        algorithm = request.algorithm
+        limits = request.limits
+        max_depth = limits["depth"]
+        time_limit = limits["time"]
+        node_limit = limits["nodes"]
+        if request.stopped:
+            max_depth, time_limit, node_limit = 1, None, None
+
+        algorithm.quiescence_budget = limits["quiescence"]
+        algorithm.late_move_reductions = limits["lmr"]
+        algorithm.futility_pruning = limits["futility"]
+
+        state = request.state
+        start = time.perf_counter()
+
+        def report(depth: int, score: float, move: int) -> None:
+            elapsed = time.perf_counter() - start
+            nodes = algorithm.get_nodes_visited() + algorithm.get_quiescence_nodes()
+            pv = " ".join(move_to_text(m) for m in algorithm.principal_variation)
+            self.send(
+                f"info depth {depth} score {score:g} nodes {nodes} "
+                f"nps {nodes / elapsed if elapsed > 0 else 0:.0f} "
+                f"time {elapsed * 1000:.0f} pv {pv}"
+            )
+
+        try:
+            _, best_move = algorithm.iterative_deepening(
+                state,
+                state.current_player,
+                max_depth,
+                soft_time_limit=(
+                    time_limit * MinimaxAlgorithm.SOFT_LIMIT_FRACTION
+                    if time_limit
+                    else None
+                ),
+                hard_time_limit=time_limit,
+                iteration_callback=report,
+                node_limit=node_limit,
+            )
+        finally:
+            self.server.finished(request)
+
+        best = move_to_text(best_move) if best_move is not None else "none"
+        self.finish(request, f"bestmove {best}")
+
+
+class _ConnectionHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        def write(text: str) -> None:
+            self.wfile.write(text.encode())
+            self.wfile.flush()
+
+        session = Session(self.server.engine, write)
+        try:
+            for raw in self.rfile:
+                if not session.handle(raw.decode(errors="replace")):
+                    break
+            else:
+                # Input ended without quit: answer what was asked first
+                session.drain()
+        finally:
+            # A client that disconnects mid-search doesn't hold up others
+            session.close()
+
+
+class _SocketServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+def serve_stdio(server: EngineServer) -> None:
+    def write(text: str) -> None:
+        sys.stdout.write(text)
+        sys.stdout.flush()
+
+    session = Session(server, write)
+    for line in sys.stdin:
+        if not session.handle(line):
+            break
+    else:
+        # Piped input ends before the search does; quit stops it instead
+        session.drain()
+        session.close()
+
+
+def serve_socket(server: EngineServer, path: str) -> None:
+    if os.path.exists(path):
+        os.unlink(path)
+    with _SocketServer(path, _ConnectionHandler) as socket_server:
+        socket_server.engine = server
+        # Stopped by a service manager like Ctrl-C, so the socket is removed
+        signal.signal(signal.SIGTERM, signal.default_int_handler)
+        try:
+            socket_server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            os.unlink(path)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description=__doc__.splitlines()[0],
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="\n".join(__doc__.splitlines()[2:]),
+    )
+    parser.add_argument("--socket", help="listen on this Unix socket path")
+    parser.add_argument(
+        "--tt-size",
+        type=float,
+        default=TranspositionTable.DEFAULT_SIZE_MB,
+        help="transposition table size (MB)",
+    )
+    args = parser.parse_args(argv)
+
+    server = EngineServer(args.tt_size)
+    try:
+        if args.socket:
+            serve_socket(server, args.socket)
+        else:
+            serve_stdio(server)
+    finally:
+        server.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
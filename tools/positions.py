@@ -0,0 +1,64 @@
+"""Positions as the engine server's position command and the analysis
+tool's input lines give them.
+
+    startpos [moves a2a3 b7b6 ...]
+    fen <rows> <w|b> <winner|-> [moves ...]
+    board <8 rows of W/B/. joined by "/"> <white|black> [moves ...]
+
+Malformed or illegal input raises ValueError.
+"""
+
+from typing import List
+
+from model import GameRules, GameState, MoveValidator, PositionSerializer, decode_move
+from model.moves import FROM_TO_MASK, TO_SHIFT, parse_move_text
+
+# Side names in the board form, to side letters in the text form
+PLAYER_NAMES = {"white": "w", "black": "b"}
+
+
+def start_position() -> GameState:
+    state = GameState()
+    GameRules.setup_initial_position(state)
+    return state
+
+
+def parse_position(args: List[str]) -> GameState:
+    """The position from the words of a position command."""
+    if args[:1] == ["startpos"]:
+        state = start_position()
+        rest = args[1:]
+    elif args[:1] == ["fen"] and len(args) >= 4:
+        state = PositionSerializer.from_text(" ".join(args[1:4]))
+        rest = args[4:]
+    elif args[:1] == ["board"] and len(args) >= 3:
+        if args[2] not in PLAYER_NAMES:
+            raise ValueError(f"unknown side to move {args[2]!r}")
+        state = PositionSerializer.from_text(f"{args[1]} {PLAYER_NAMES[args[2]]} -")
+        rest = args[3:]
+    else:
+        raise ValueError(
+            "position startpos|fen <rows> <side> <winner>|board <rows> <side> "
+            "[moves ...]"
+        )
+
+    if rest:
+        if rest[0] != "moves":
+            raise ValueError(f"unexpected {rest[0]!r}")
+        for text in rest[1:]:
+            if GameRules.is_game_over(state):
+                raise ValueError(f"game is over before {text}")
+            play_move(state, text)
+    return state
+
+
+def play_move(state: GameState, text: str) -> None:
+    from_sq, to_sq = parse_move_text(text)
+
+    # The generated move carries the capture flag the text doesn't
+    key = from_sq | (to_sq << TO_SHIFT)
+    for move in MoveValidator.get_all_valid_moves(state, state.current_player):
+        if move & FROM_TO_MASK == key:
+            GameRules.execute_move(state, *decode_move(move))
+            return
+    raise ValueError(f"illegal move {text}")
@@ -0,0 +1,65 @@
+"""Append-only JSON lines files shared by the batch tools.
+
+The first line records the settings the file was written with; every
+other line is one result. A run with the same settings resumes from the
+results already there, and a run with different settings is refused.
+"""
+
+import json
+import os
+from typing import Iterator, List, TextIO
+
+
+class SettingsMismatchError(ValueError):
+    pass
+
+
+def load_records(path: str, settings: dict) -> List[dict]:
+    """Results already in the file, after checking it matches settings."""
+    return list(iter_records(path, settings))
+
+
+def iter_records(path: str, settings: dict) -> Iterator[dict]:
+    """The same results one at a time, for files too big to hold."""
+    if not os.path.exists(path):
+        return
+
+    with open(path) as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                # A run killed mid-write leaves a torn last line
+                continue
+            if record.get("type") == "settings":
+                if record["settings"] != settings:
+                    raise SettingsMismatchError(
+                        f"{path} was written with different settings; "
+                        "use a new file"
+                    )
+            else:
+                yield record
+
+
+def open_for_append(path: str, settings: dict) -> TextIO:
+    """The file opened to append results, with its settings line written."""
+    # Start clean after a torn final line from an interrupted run
+    torn = _ends_mid_line(path)
+    out = open(path, "a")
+    if torn:
+        out.write("\n")
+    if not out.tell():
+        out.write(json.dumps({"type": "settings", "settings": settings}) + "\n")
+        out.flush()
+    return out
+
+
+def _ends_mid_line(path: str) -> bool:
+    if not os.path.exists(path) or not os.path.getsize(path):
+        return False
+    with open(path, "rb") as f:
+        f.seek(-1, os.SEEK_END)
+        return f.read(1) != b"\n"
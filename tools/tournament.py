@@ -0,0 +1,323 @@
+"""Headless self-play matches between two engine configurations.
+
+Usage:
+    python -m tools.tournament --engine-a depth=3 --engine-b time=0.5 \\
+        --games 100 --results match.jsonl
+
+An engine spec is a comma-separated list of key=value pairs:
+depth, time (seconds per move), quiescence (node budget per leaf, 0 to
+disable), lmr and futility (1 or 0 to switch late move reductions and
+futility pruning on or off), material, advancement, mobility.
+Results are appended to the results file one game per line; rerunning
+with the same file and settings resumes an interrupted match.
+"""
+
+import argparse
+import json
+import math
+import os
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import List, Optional, Tuple
+
+from controller.ai_algorithm import MinimaxAlgorithm
+from model import (
+    GameRules,
+    GameState,
+    MoveValidator,
+    PositionEvaluator,
+    decode_move,
+)
+from tools.results import SettingsMismatchError, load_records, open_for_append
+
+WEIGHT_KEYS = {
+    "material": "MATERIAL_VALUE",
+    "advancement": "ADVANCEMENT_VALUE",
+    "mobility": "MOBILITY_VALUE",
+}
+
+_DEFAULT_WEIGHTS = {
+    key: getattr(PositionEvaluator, attribute)
+    for key, attribute in WEIGHT_KEYS.items()
+}
+
+# Every move advances a piece, so real games end long before this
+MAX_PLIES = 300
+
+
+def parse_engine_spec(spec: str) -> dict:
+    config = {}
+    for item in spec.split(","):
+        if not item.strip():
+            continue
+        key, _, value = item.partition("=")
+        key = key.strip()
+        if key == "depth":
+            config["depth"] = int(value)
+        elif key == "time":
+            config["time"] = float(value)
+        elif key == "quiescence":
+            config["quiescence"] = int(value)
+        elif key in ("lmr", "futility"):
+            config[key] = bool(int(value))
+        elif key in WEIGHT_KEYS:
+            config[key] = float(value)
+        else:
+            raise ValueError(f"unknown engine option {key!r}")
+
+    if "depth" not in config and "time" not in config:
+        config["depth"] = 3
+    return config
+
+
+def _apply_weights(config: dict) -> None:
+    # The evaluator reads its weights from class attributes, and each
+    # worker process plays one game at a time, so swap them per move
+    for key, attribute in WEIGHT_KEYS.items():
+        setattr(PositionEvaluator, attribute, config.get(key, _DEFAULT_WEIGHTS[key]))
+
+
+def _make_engine(config: dict) -> MinimaxAlgorithm:
+    return MinimaxAlgorithm(
+        quiescence_budget=config.get(
+            "quiescence", MinimaxAlgorithm.QUIESCENCE_NODE_BUDGET
+        ),
+        late_move_reductions=config.get("lmr", True),
+        futility_pruning=config.get("futility", True),
+    )
+
+
+def _opening(pair: int, seed: int, plies: int) -> list:
+    # Both games of a pair share the opening, with colours swapped
+    rng = random.Random(seed * 1_000_003 + pair)
+    state = GameState()
+    GameRules.setup_initial_position(state)
+
+    moves = []
+    for _ in range(plies):
+        legal = MoveValidator.get_all_valid_moves(state, state.current_player)
+        if not legal or state.winner is not None:
+            break
+        from_pos, to_pos = decode_move(rng.choice(legal))
+        GameRules.execute_move(state, from_pos, to_pos)
+        moves.append((from_pos, to_pos))
+    return moves
+
+
+def play_game(
+    index: int, engine_a: dict, engine_b: dict, seed: int, opening_plies: int
+) -> dict:
+    pair = index // 2
+    a_color = GameState.WHITE if index % 2 == 0 else GameState.BLACK
+
+    state = GameState()
+    GameRules.setup_initial_position(state)
+    for from_pos, to_pos in _opening(pair, seed, opening_plies):
+        GameRules.execute_move(state, from_pos, to_pos)
+
+    engines = {
+        a_color: ("a", engine_a, _make_engine(engine_a)),
+        GameRules.get_opponent(a_color): ("b", engine_b, _make_engine(engine_b)),
+    }
+    totals = {"a": [0, 0.0], "b": [0, 0.0]}
+    plies = 0
+
+    while not GameRules.is_game_over(state) and plies < MAX_PLIES:
+        player = state.current_player
+        name, config, algorithm = engines[player]
+        _apply_weights(config)
+
+        time_limit = config.get("time")
+        start = time.perf_counter()
+        _, move = algorithm.iterative_deepening(
+            state,
+            player,
+            config.get("depth", MinimaxAlgorithm.MAX_TIMED_DEPTH),
+            soft_time_limit=(
+                time_limit * MinimaxAlgorithm.SOFT_LIMIT_FRACTION
+                if time_limit
+                else None
+            ),
+            hard_time_limit=time_limit,
+        )
+        totals[name][0] += (
+            algorithm.get_nodes_visited() + algorithm.get_quiescence_nodes()
+        )
+        totals[name][1] += time.perf_counter() - start
+
+        if move is None:
+            break
+        GameRules.execute_move(state, *decode_move(move))
+        plies += 1
+
+    winner = GameRules.get_winner(state)
+    if winner is None:
+        result = "draw"
+    else:
+        result = "a" if winner == a_color else "b"
+
+    return {
+        "game": index,
+        "result": result,
+        "a_color": "white" if a_color == GameState.WHITE else "black",
+        "plies": plies,
+        "a_nodes": totals["a"][0],
+        "a_time": totals["a"][1],
+        "b_nodes": totals["b"][0],
+        "b_time": totals["b"][1],
+    }
+
+
+def elo_estimate(wins: int, draws: int, losses: int) -> Tuple[float, float]:
+    """Elo difference of A over B and its 95% margin, from the match score.
+
+    Both are infinite when one side scored every point, and the margin is
+    infinite whenever the interval reaches a score of 0 or 1.
+    """
+    games = wins + draws + losses
+    if games == 0:
+        return 0.0, float("inf")
+
+    score = (wins + draws / 2) / games
+    # Per-game score variance, including draws
+    variance = (
+        wins * (1 - score) ** 2 + draws * (0.5 - score) ** 2 + losses * score**2
+    ) / games
+    margin = 1.96 * math.sqrt(variance / games)
+
+    def to_elo(p: float) -> float:
+        if p <= 0:
+            return float("-inf")
+        if p >= 1:
+            return float("inf")
+        return 400 * math.log10(p / (1 - p))
+
+    elo = to_elo(score)
+    if math.isinf(elo):
+        return elo, float("inf")
+    return elo, (to_elo(score + margin) - to_elo(score - margin)) / 2
+
+
+def format_elo(elo: float, margin: float, places: int = 0) -> str:
+    if math.isinf(elo):
+        # No finite difference fits a perfect score
+        return f"n/a (every point to {'A' if elo > 0 else 'B'})"
+    return f"{elo:+.{places}f} ±{margin:.{places}f}"
+
+
+def summarize(games: List[dict]) -> dict:
+    wins = sum(1 for g in games if g["result"] == "a")
+    losses = sum(1 for g in games if g["result"] == "b")
+    draws = sum(1 for g in games if g["result"] == "draw")
+    elo, margin = elo_estimate(wins, draws, losses)
+
+    def nps(side: str) -> float:
+        seconds = sum(g[f"{side}_time"] for g in games)
+        return sum(g[f"{side}_nodes"] for g in games) / seconds if seconds else 0.0
+
+    return {
+        "games": len(games),
+        "wins": wins,
+        "draws": draws,
+        "losses": losses,
+        "elo": elo,
+        "elo_margin": margin,
+        "a_nodes_per_second": nps("a"),
+        "b_nodes_per_second": nps("b"),
+    }
+
+
+def run_match(
+    engine_a: dict,
+    engine_b: dict,
+    games: int,
+    results_path: str,
+    seed: int = 0,
+    opening_plies: int = 4,
+    workers: Optional[int] = None,
+) -> dict:
+    settings = {
+        "engine_a": engine_a,
+        "engine_b": engine_b,
+        "seed": seed,
+        "opening_plies": opening_plies,
+    }
+    finished = load_records(results_path, settings)
+    done = {g["game"] for g in finished}
+    remaining = [index for index in range(games) if index not in done]
+
+    with open_for_append(results_path, settings) as out:
+        with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as executor:
+            futures = [
+                executor.submit(
+                    play_game, index, engine_a, engine_b, seed, opening_plies
+                )
+                for index in remaining
+            ]
+            for future in as_completed(futures):
+                record = future.result()
+                out.write(json.dumps(record) + "\n")
+                out.flush()
+                finished.append(record)
+
+                summary = summarize(finished)
+                print(
+                    f"game {record['game']:>4}: {record['result']:>4} | "
+                    f"+{summary['wins']} ={summary['draws']} -{summary['losses']} "
+                    f"Elo {format_elo(summary['elo'], summary['elo_margin'])}",
+                    flush=True,
+                )
+
+    return summarize([g for g in finished if g["game"] < games])
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description=__doc__.splitlines()[0],
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="\n".join(__doc__.splitlines()[2:]),
+    )
+    parser.add_argument("--engine-a", required=True, type=parse_engine_spec)
+    parser.add_argument("--engine-b", required=True, type=parse_engine_spec)
+    parser.add_argument("--games", type=int, default=100)
+    parser.add_argument("--results", required=True, help="append-only JSONL file")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--opening-plies", type=int, default=4, help="random plies before play"
+    )
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    try:
+        summary = run_match(
+            args.engine_a,
+            args.engine_b,
+            args.games,
+            args.results,
+            seed=args.seed,
+            opening_plies=args.opening_plies,
+            workers=args.workers,
+        )
+    except SettingsMismatchError as error:
+        print(error, file=sys.stderr)
+        return 1
+
+    print(
+        f"\n{summary['games']} games: +{summary['wins']} ={summary['draws']} "
+        f"-{summary['losses']} for engine A"
+    )
+    print(
+        "Elo difference (A - B): "
+        + format_elo(summary["elo"], summary["elo_margin"], places=1)
+    )
+    print(
+        f"Nodes/sec: A {summary['a_nodes_per_second']:,.0f}, "
+        f"B {summary['b_nodes_per_second']:,.0f}"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -13,6 +13,12 @@ from view.styles import Colors, Dimensions
 
 
 class BoardView(QGraphicsView):
+    """Draws the model's board, flipped so the human's side is at the bottom.
+
+    Every method takes and emits model coordinates; only this class knows
+    which way up the board is shown.
+    """
+
     square_clicked = pyqtSignal(int, int)  # (row, col)
 
     def __init__(self):
@@ -22,13 +28,27 @@ class BoardView(QGraphicsView):
         self.setScene(self.scene)
 
         self.squares = []
-        self.pieces = {}
+        self.flipped = False
+        # One piece item per square, shown or hidden as the board changes
+        self.pieces = []
+        self.drawn_board = []
+
+        # Highlight items are reused: the first active_highlights are shown
         self.highlights = []
+        self.active_highlights = 0
+        self.thinking_highlights = []
 
-        self.thinking_moves = []
+        self.piece_styles = {
+            1: (QBrush(Colors.WHITE_PIECE), QPen(Colors.WHITE_PIECE_BORDER, 2)),
+            2: (QBrush(Colors.BLACK_PIECE), QPen(Colors.BLACK_PIECE_BORDER, 2)),
+        }
 
         self._setup_view()
         self._create_board()
+        self._create_pieces()
+        self.thinking_highlights = [
+            self._create_highlight(Colors.THINKING_HIGHLIGHT) for _ in range(2)
+        ]
 
     def _setup_view(self):
         self.setRenderHint(QPainter.RenderHint.Antialiasing)
@@ -68,38 +88,62 @@ class BoardView(QGraphicsView):
 
             self.squares.append(row_squares)
 
-    def update_board(self, board: List[List[int]]):
-        for piece in self.pieces.values():
-            self.scene.removeItem(piece)
-        self.pieces.clear()
-
+    def _create_pieces(self):
         for row in range(Dimensions.BOARD_SIZE):
+            row_pieces = []
+
             for col in range(Dimensions.BOARD_SIZE):
-                piece_type = board[row][col]
-                if piece_type != 0:
-                    self._create_piece(row, col, piece_type)
-
-    def _create_piece(self, row: int, col: int, piece_type: int):
-        x = col * Dimensions.SQUARE_SIZE + Dimensions.SQUARE_SIZE / 2
-        y = row * Dimensions.SQUARE_SIZE + Dimensions.SQUARE_SIZE / 2
-
-        piece = QGraphicsEllipseItem(
-            x - Dimensions.PIECE_RADIUS,
-            y - Dimensions.PIECE_RADIUS,
-            Dimensions.PIECE_RADIUS * 2,
-            Dimensions.PIECE_RADIUS * 2,
-        )
+                x = col * Dimensions.SQUARE_SIZE + Dimensions.SQUARE_SIZE / 2
+                y = row * Dimensions.SQUARE_SIZE + Dimensions.SQUARE_SIZE / 2
+
+                piece = QGraphicsEllipseItem(
+                    x - Dimensions.PIECE_RADIUS,
+                    y - Dimensions.PIECE_RADIUS,
+                    Dimensions.PIECE_RADIUS * 2,
+                    Dimensions.PIECE_RADIUS * 2,
+                )
+                piece.setZValue(Dimensions.Z_PIECE)
+                piece.setVisible(False)
+
+                self.scene.addItem(piece)
+                row_pieces.append(piece)
+
+            self.pieces.append(row_pieces)
+            self.drawn_board.append([0] * Dimensions.BOARD_SIZE)
+
+    def set_flipped(self, flipped: bool):
+        # White starts at the top of the model; flip to show it at the bottom
+        self.flipped = flipped
 
-        if piece_type == 1:  # White
-            piece.setBrush(QBrush(Colors.WHITE_PIECE))
-            piece.setPen(QPen(Colors.WHITE_PIECE_BORDER, 2))
-        else:  # Black
-            piece.setBrush(QBrush(Colors.BLACK_PIECE))
-            piece.setPen(QPen(Colors.BLACK_PIECE_BORDER, 2))
+    def _display_row(self, row: int) -> int:
+        # The flip is its own inverse, so this maps both ways
+        return Dimensions.BOARD_SIZE - 1 - row if self.flipped else row
 
-        piece.setZValue(Dimensions.Z_PIECE)
-        self.scene.addItem(piece)
-        self.pieces[(row, col)] = piece
+    def update_board(self, board: List[List[int]]):
+        # Only squares that changed since the last call are touched: two
+        # for a move or a capture, more after a new game or a flip
+        for row in range(Dimensions.BOARD_SIZE):
+            drawn_row = self.drawn_board[row]
+            board_row = board[self._display_row(row)]
+            if drawn_row == board_row:
+                continue
+
+            for col in range(Dimensions.BOARD_SIZE):
+                piece_type = board_row[col]
+                if piece_type != drawn_row[col]:
+                    self._set_piece(row, col, piece_type)
+                    drawn_row[col] = piece_type
+
+    def _set_piece(self, row: int, col: int, piece_type: int):
+        piece = self.pieces[row][col]
+        if piece_type == 0:
+            piece.setVisible(False)
+            return
+
+        brush, pen = self.piece_styles[piece_type]
+        piece.setBrush(brush)
+        piece.setPen(pen)
+        piece.setVisible(True)
 
     def mousePressEvent(self, event):
         pos = self.mapToScene(event.pos())
@@ -107,27 +151,43 @@ class BoardView(QGraphicsView):
         row = int(pos.y() // Dimensions.SQUARE_SIZE)
 
         if 0 <= row < Dimensions.BOARD_SIZE and 0 <= col < Dimensions.BOARD_SIZE:
-            self.square_clicked.emit(row, col)
-
-    def highlight_square(self, row: int, col: int, color):
-        x = col * Dimensions.SQUARE_SIZE
-        y = row * Dimensions.SQUARE_SIZE
+            self.square_clicked.emit(self._display_row(row), col)
 
+    def _create_highlight(self, color) -> QGraphicsRectItem:
         highlight = QGraphicsRectItem(
-            x, y, Dimensions.SQUARE_SIZE, Dimensions.SQUARE_SIZE
+            0, 0, Dimensions.SQUARE_SIZE, Dimensions.SQUARE_SIZE
         )
         highlight.setBrush(QBrush(color))
         highlight.setPen(QPen(Qt.PenStyle.NoPen))
         highlight.setZValue(Dimensions.Z_HIGHLIGHT)
+        highlight.setVisible(False)
 
         self.scene.addItem(highlight)
-        self.highlights.append(highlight)
+        return highlight
+
+    def _place_highlight(self, highlight, row: int, col: int):
+        row = self._display_row(row)
+        highlight.setPos(col * Dimensions.SQUARE_SIZE, row * Dimensions.SQUARE_SIZE)
+        highlight.setVisible(True)
+
+    def highlight_square(self, row: int, col: int, color):
+        # The pool only grows to the most highlights ever shown at once
+        if self.active_highlights == len(self.highlights):
+            self.highlights.append(self._create_highlight(color))
+
+        highlight = self.highlights[self.active_highlights]
+        if highlight.brush().color() != color:
+            highlight.setBrush(QBrush(color))
+        self._place_highlight(highlight, row, col)
+        self.active_highlights += 1
 
     def clear_highlights(self):
-        for highlight in self.highlights:
-            self.scene.removeItem(highlight)
-        self.highlights.clear()
-        self.thinking_moves.clear()
+        for highlight in self.highlights[: self.active_highlights]:
+            highlight.setVisible(False)
+        self.active_highlights = 0
+
+        for highlight in self.thinking_highlights:
+            highlight.setVisible(False)
 
     def show_selected(self, row: int, col: int):
         self.clear_highlights()
@@ -142,13 +202,7 @@ class BoardView(QGraphicsView):
         self.highlight_square(to_pos[0], to_pos[1], Colors.LAST_MOVE_HIGHLIGHT)
 
     def show_thinking(self, from_pos: Tuple[int, int], to_pos: Tuple[int, int]):
-        if self.thinking_moves:
-            for _ in range(min(2, len(self.highlights))):
-                if self.highlights:
-                    last = self.highlights[-1]
-                    self.scene.removeItem(last)
-                    self.highlights.pop()
-
-        self.thinking_moves = [from_pos, to_pos]
-        self.highlight_square(from_pos[0], from_pos[1], Colors.THINKING_HIGHLIGHT)
-        self.highlight_square(to_pos[0], to_pos[1], Colors.THINKING_HIGHLIGHT)
+        # Two dedicated items follow the search around the board
+        from_highlight, to_highlight = self.thinking_highlights
+        self._place_highlight(from_highlight, from_pos[0], from_pos[1])
+        self._place_highlight(to_highlight, to_pos[0], to_pos[1])
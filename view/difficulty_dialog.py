@@ -16,6 +16,7 @@ class DifficultyDialog(QDialog):
         super().__init__(parent)
         
         self.selected_depth = 3  # Default to medium
+        self.selected_time_limit = None  # Seconds per move for timed levels
         
         self._setup_dialog()
         self._create_ui()
@@ -23,7 +24,7 @@ class DifficultyDialog(QDialog):
     def _setup_dialog(self):
         self.setWindowTitle("Select AI Difficulty")
         self.setModal(True)
-        self.setFixedSize(400, 300)
+        self.setFixedSize(400, 420)
         self.setStyleSheet(StyleSheets.MAIN_WINDOW)
     
     def _create_ui(self):
@@ -71,6 +72,23 @@ class DifficultyDialog(QDialog):
         self.button_group.addButton(hard_btn)
         layout.addWidget(hard_btn)
         
+        # Timed levels search as deep as the clock allows
+        timed_short_btn = QRadioButton("Timed (1 second per move)")
+        timed_short_btn.setStyleSheet(
+            "color: #87CEEB; font-size: 14px; padding: 8px;"
+        )
+        timed_short_btn.setProperty("time_limit", 1.0)
+        self.button_group.addButton(timed_short_btn)
+        layout.addWidget(timed_short_btn)
+        
+        timed_long_btn = QRadioButton("Timed (3 seconds per move)")
+        timed_long_btn.setStyleSheet(
+            "color: #6495ED; font-size: 14px; padding: 8px;"
+        )
+        timed_long_btn.setProperty("time_limit", 3.0)
+        self.button_group.addButton(timed_long_btn)
+        layout.addWidget(timed_long_btn)
+        
         layout.addStretch()
         
         # Start button
@@ -86,8 +104,16 @@ class DifficultyDialog(QDialog):
         # Get the selected difficulty
         selected_button = self.button_group.checkedButton()
         if selected_button:
-            self.selected_depth = selected_button.property("depth")
+            time_limit = selected_button.property("time_limit")
+            if time_limit is not None:
+                self.selected_time_limit = time_limit
+            else:
+                self.selected_depth = selected_button.property("depth")
+                self.selected_time_limit = None
         self.accept()
     
     def get_selected_depth(self) -> int:
         return self.selected_depth
+    
+    def get_selected_time_limit(self):
+        return self.selected_time_limit
@@ -5,6 +5,11 @@ from view.styles import StyleSheets
 
 
 class MetricsPanel(QWidget):
+    # Longer lines are cut short to keep the panel narrow
+    MAX_LINE_MOVES = 6
+    # Only the deepest iterations fit in the per-depth table
+    MAX_DEPTH_ROWS = 8
+
     def __init__(self):
         super().__init__()
 
@@ -14,6 +19,8 @@ class MetricsPanel(QWidget):
         self.complexity_label = None
         self.big_o_label = None
         self.eval_label = None
+        self.pv_label = None
+        self.depth_stats_label = None
         self.status_label = None
 
         self._setup_ui()
@@ -36,9 +43,15 @@ class MetricsPanel(QWidget):
         self.depth_label = self._create_metric_label("Search Depth:", "—")
         self.nodes_label = self._create_metric_label("Nodes Visited:", "—")
         self.time_label = self._create_metric_label("Execution Time:", "—")
-        self.complexity_label = self._create_metric_label("Branching Factor:", "—")
+        self.complexity_label = self._create_metric_label(
+            "Effective Branching Factor:", "—"
+        )
         self.big_o_label = self._create_metric_label("Complexity:", "—")
         self.eval_label = self._create_metric_label("Position Score:", "—")
+        self.pv_label = self._create_metric_label("Expected Line:", "—")
+        self.pv_label.setWordWrap(True)
+        self.depth_stats_label = QLabel("Per Depth:\n  —")
+        self.depth_stats_label.setStyleSheet(StyleSheets.METRIC_TABLE)
 
         metrics_layout.addWidget(self.depth_label)
         metrics_layout.addWidget(self.nodes_label)
@@ -46,6 +59,8 @@ class MetricsPanel(QWidget):
         metrics_layout.addWidget(self.complexity_label)
         metrics_layout.addWidget(self.big_o_label)
         metrics_layout.addWidget(self.eval_label)
+        metrics_layout.addWidget(self.pv_label)
+        metrics_layout.addWidget(self.depth_stats_label)
 
         metrics_group.setLayout(metrics_layout)
         layout.addWidget(metrics_group)
@@ -70,13 +85,19 @@ class MetricsPanel(QWidget):
     def update_metrics(self, metrics: dict):
         depth = metrics.get("depth", "—")
         nodes = metrics.get("nodes_visited", "—")
+        quiescence_nodes = metrics.get("quiescence_nodes")
         exec_time = metrics.get("execution_time", "—")
         branch_factor = metrics.get("branching_factor", "—")
         evaluation = metrics.get("evaluation", "—")
+        principal_variation = metrics.get("principal_variation")
 
         self.depth_label.setText(f"Search Depth:\n  {depth}")
 
-        if isinstance(nodes, int):
+        if isinstance(nodes, int) and quiescence_nodes:
+            self.nodes_label.setText(
+                f"Nodes Visited:\n  {nodes:,} + {quiescence_nodes:,} quiescence"
+            )
+        elif isinstance(nodes, int):
             self.nodes_label.setText(f"Nodes Visited:\n  {nodes:,}")
         else:
             self.nodes_label.setText(f"Nodes Visited:\n  {nodes}")
@@ -87,10 +108,14 @@ class MetricsPanel(QWidget):
             self.time_label.setText(f"Execution Time:\n  {exec_time}")
 
         if isinstance(branch_factor, float):
-            self.complexity_label.setText(f"Branching Factor:\n  {branch_factor:.2f}")
+            self.complexity_label.setText(
+                f"Effective Branching Factor:\n  {branch_factor:.2f}"
+            )
             self.big_o_label.setText(f"Complexity:\n  O({branch_factor:.1f}^{depth})")
         else:
-            self.complexity_label.setText(f"Branching Factor:\n  {branch_factor}")
+            self.complexity_label.setText(
+                f"Effective Branching Factor:\n  {branch_factor}"
+            )
             self.big_o_label.setText(f"Complexity:\n  —")
 
         if isinstance(evaluation, (int, float)):
@@ -98,6 +123,63 @@ class MetricsPanel(QWidget):
         else:
             self.eval_label.setText(f"Position Score:\n  {evaluation}")
 
+        self._set_expected_line(principal_variation)
+        self._set_depth_stats(metrics.get("search_stats"))
+
+    def update_progress(self, progress: dict):
+        # Live view of a search still running; the final metrics replace it
+        depth = progress.get("depth", "—")
+        nodes = progress.get("nodes_visited", 0)
+
+        self.depth_label.setText(f"Search Depth:\n  {depth} (searching)")
+        self.nodes_label.setText(f"Nodes Visited:\n  {nodes:,}")
+        self._set_expected_line(progress.get("principal_variation"))
+
+    def _set_expected_line(self, principal_variation):
+        if principal_variation:
+            line = " ".join(
+                self._format_move(move)
+                for move in principal_variation[: self.MAX_LINE_MOVES]
+            )
+            if len(principal_variation) > self.MAX_LINE_MOVES:
+                line += " …"
+            self.pv_label.setText(f"Expected Line:\n  {line}")
+        else:
+            self.pv_label.setText("Expected Line:\n  —")
+
+    def _set_depth_stats(self, search_stats):
+        if not search_stats or not search_stats["depths"]:
+            self.depth_stats_label.setText("Per Depth:\n  —")
+            return
+
+        rows = ["Per Depth:", "  d      nodes   ebf  cut1   time"]
+        for record in search_stats["depths"][-self.MAX_DEPTH_ROWS :]:
+            ebf = record["branching_factor"]
+            ebf = f"{ebf:>6.1f}" if ebf is not None else f"{'—':>6}"
+            # An asterisk marks an iteration cut short by the clock
+            rows.append(
+                f"{record['depth']:>2}{' ' if record['completed'] else '*'}"
+                f"{record['nodes']:>10,}{ebf}"
+                f"{record['first_move_cutoff_rate']:>6.0%}"
+                f"{record['time']:>7.2f}s"
+            )
+
+        phase_times = search_stats.get("phase_times")
+        if phase_times:
+            rows.append(
+                " gen {move_generation:.2f}s  eval {evaluation:.2f}s"
+                "  make {make_unmake:.2f}s".format(**phase_times)
+            )
+        self.depth_stats_label.setText("\n".join(rows))
+
+    def _format_move(self, move: tuple) -> str:
+        # Files a-h by column, ranks 1-8 by model row: White starts on 1-2
+        (from_row, from_col), (to_row, to_col) = move
+        return (
+            f"{chr(ord('a') + from_col)}{from_row + 1}"
+            f"-{chr(ord('a') + to_col)}{to_row + 1}"
+        )
+
     def set_status(self, status: str, color: str = None):
         if color is None:
             color = "#90EE90"
@@ -109,7 +191,9 @@ class MetricsPanel(QWidget):
         self.depth_label.setText("Search Depth:\n  —")
         self.nodes_label.setText("Nodes Visited:\n  —")
         self.time_label.setText("Execution Time:\n  —")
-        self.complexity_label.setText("Branching Factor:\n  —")
+        self.complexity_label.setText("Effective Branching Factor:\n  —")
         self.big_o_label.setText("Complexity:\n  —")
         self.eval_label.setText("Position Score:\n  —")
+        self.pv_label.setText("Expected Line:\n  —")
+        self.depth_stats_label.setText("Per Depth:\n  —")
         self.set_status("Waiting", "#90EE90")
@@ -103,6 +103,17 @@ class StyleSheets:
         }
     """
 
+    METRIC_TABLE = """
+        QLabel {
+            font-size: 12px;
+            font-family: monospace;
+            color: #D0D0D0;
+            padding: 8px;
+            background-color: #404045;
+            border-radius: 4px;
+        }
+    """
+
     STATUS_LABEL = """
         QLabel {{
             font-size: 14px;